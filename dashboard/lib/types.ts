@@ -54,6 +54,10 @@ export interface RemediationSession {
   error_message: string | null;
   data_source: "live" | "mock";
   version: number;
+  // Adaptive polling
+  stage_entered_at: string | null;
+  next_poll_at: string | null;
+  webhook_confirmed: boolean;
   // HITL review fields
   review_status: "pending" | "approved" | "rejected" | null;
   reviewed_by: string | null;
@@ -88,6 +92,7 @@ export interface BatchRun {
   status: string;
   data_source: "live" | "mock" | "hybrid";
   events: TimelineEvent[];
+  stage_dwell: Record<string, [number, number]>;
 }
 
 /** Summary entry for runs/index.json */
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import bisect
+import itertools
 import logging
 import random
 import re
 import time
-import uuid
+from collections import defaultdict
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 # Stage definitions: (name, min_duration_s, max_duration_s, progress_start, progress_end)
-_STAGES = [
+_STAGES: tuple[tuple[str, int, int, int, int], ...] = (
     ("analyzing", 5, 10, 0, 25),
     ("fixing", 10, 20, 25, 60),
     ("testing", 8, 15, 60, 85),
     ("creating_pr", 3, 8, 85, 95),
-]
+)
+
+# (name, progress_start, progress_end) per stage, aligned with a session's cumulative end times
+_STAGE_INFO: tuple[tuple[str, int, int], ...] = tuple(
+    (name, p_start, p_end) for name, _, _, p_start, p_end in _STAGES
+)
 
 # Fix approaches per category
 _FIX_APPROACHES: dict[str, str] = {
@@ -60,29 +67,58 @@ _FILE_TEMPLATES: dict[str, list[str]] = {
     ],
 }
 
+_KNOWN_CATEGORIES: tuple[str, ...] = tuple(_FIX_APPROACHES)
+_KNOWN_CATEGORY_SET: frozenset[str] = frozenset(_KNOWN_CATEGORIES)
+
+# Single-pass multi-pattern matcher over the normalized prompt (longest names first)
+_CATEGORY_RE = re.compile(
+    "|".join(re.escape(cat) for cat in sorted(_KNOWN_CATEGORIES, key=len, reverse=True))
+)
+
+# Display titles per category, e.g. "sql_injection" -> "Sql Injection"
+_CATEGORY_TITLES: dict[str, str] = {
+    cat: cat.replace("_", " ").title() for cat in _FIX_APPROACHES
+}
+
+# Reported stage order; the index decides which fields are populated
+_STAGE_ORDER: tuple[str, ...] = (
+    "analyzing", "fixing", "testing", "creating_pr", "completed", "failed",
+)
+_STAGE_INDEX: dict[str, int] = {name: i for i, name in enumerate(_STAGE_ORDER)}
+
+# current_step message per stage, formatted once per session
+_STEP_MSG_TEMPLATES: dict[str, str] = {
+    "analyzing": "Analyzing finding {finding_id}: {category_title} in {service}",
+    "fixing": "Applying fix for {finding_id} — {fix_approach}",
+    "testing": "Running test suite — validating fix for {finding_id}",
+    "creating_pr": "Creating pull request with fix for {finding_id}",
+    "completed": "Pull request created successfully",
+    "failed": "Tests failed after applying fix",
+}
+
+_FIND_RE = re.compile(r"FIND-\d+")
+_SERVICE_RE = re.compile(r"([\w-]+-service)")
+
 
 def _extract_finding_id(prompt: str) -> str:
     """Extract a finding ID like FIND-0001 from a prompt string."""
-    match = re.search(r"FIND-\d+", prompt)
+    match = _FIND_RE.search(prompt)
     return match.group(0) if match else "FIND-UNKNOWN"
 
 
 def _extract_category(prompt: str, tags: list[str] | None) -> str:
     """Best-effort extraction of finding category from prompt or tags."""
-    known = list(_FIX_APPROACHES.keys())
     if tags:
         for tag in tags:
-            if tag in known:
+            if tag in _KNOWN_CATEGORY_SET:
                 return tag
-    for cat in known:
-        if cat in prompt.lower().replace(" ", "_"):
-            return cat
-    return "other"
+    match = _CATEGORY_RE.search(prompt.lower().replace(" ", "_"))
+    return match.group(0) if match else "other"
 
 
 def _extract_service(prompt: str, tags: list[str] | None) -> str:
     """Best-effort extraction of service name from prompt or tags."""
-    match = re.search(r"([\w-]+-service)", prompt)
+    match = _SERVICE_RE.search(prompt)
     if match:
         return match.group(1)
     if tags:
@@ -95,7 +131,7 @@ def _extract_service(prompt: str, tags: list[str] | None) -> str:
 class MockDevinClient:
     """Simulates the Devin API with realistic timing and state transitions.
 
-    Sessions progress through stages based on elapsed wall-clock time:
+    Sessions progress through stages based on elapsed (monotonic) time:
       analyzing (5-10s) -> fixing (10-20s) -> testing (8-15s) -> creating_pr (3-8s) -> completed
 
     ~85% of sessions succeed. ~15% fail (get stuck at 'testing' with status 'blocked').
@@ -105,6 +141,17 @@ class MockDevinClient:
         self._rng = random.Random(seed)
         self._sessions: dict[str, dict[str, Any]] = {}
         self._playbooks: dict[str, dict[str, Any]] = {}
+        # prompt -> session_id, for O(1) idempotent lookups
+        self._prompt_index: dict[str, str] = {}
+        # tag -> session_ids carrying that tag, for list_sessions filtering
+        self._tag_index: defaultdict[str, set[str]] = defaultdict(set)
+
+    def _new_id(self, prefix: str, existing: dict[str, Any]) -> str:
+        """Return a short random id from the (seedable) RNG, unique within `existing`."""
+        while True:
+            new_id = f"{prefix}{self._rng.getrandbits(32):08x}"
+            if new_id not in existing:
+                return new_id
 
     async def create_session(
         self,
@@ -114,44 +161,90 @@ class MockDevinClient:
         structured_output_schema: dict[str, Any] | None = None,
         max_acu_limit: int | None = None,
         idempotent: bool = True,
+        structured_output_schema_json: str | None = None,
+        webhook_url: str | None = None,
     ) -> dict[str, Any]:
         """Create a mock session. Returns immediately with a fake session_id."""
         # Idempotent check: return existing session with the same prompt
         if idempotent:
-            for sid, state in self._sessions.items():
-                if state["prompt"] == prompt:
-                    logger.debug("Idempotent hit for prompt: %s", prompt[:60])
-                    return {
-                        "session_id": sid,
-                        "url": f"https://app.devin.ai/sessions/{sid}",
-                        "is_new_session": False,
-                    }
-
-        session_id = f"mock-{uuid.uuid4().hex[:8]}"
-        will_fail = self._rng.random() < 0.15
+            sid = self._prompt_index.get(prompt)
+            if sid is not None:
+                logger.debug("Idempotent hit for prompt: %s", prompt[:60])
+                return {
+                    "session_id": sid,
+                    "url": f"https://app.devin.ai/sessions/{sid}",
+                    "is_new_session": False,
+                }
+
+        # Draw all per-session randomness up front; polls only read these values
+        rng = self._rng
+        randoms: dict[str, Any] = {
+            "will_fail": rng.random() < 0.15,
+            "durations": tuple(
+                rng.uniform(min_dur, max_dur) for _, min_dur, max_dur, _, _ in _STAGES
+            ),
+            "confidence": rng.choice(["high", "medium"]),
+            "tests_added": rng.randint(1, 5),
+            "pr_number": rng.randint(10, 999),
+        }
+        will_fail = randoms["will_fail"]
+        session_id = self._new_id("mock-", self._sessions)
         finding_id = _extract_finding_id(prompt)
         category = _extract_category(prompt, tags)
         service = _extract_service(prompt, tags)
 
-        # Randomized stage durations within spec ranges
-        stage_durations: list[tuple[str, float, int, int]] = []
-        for name, min_dur, max_dur, p_start, p_end in _STAGES:
-            dur = self._rng.uniform(min_dur, max_dur)
-            stage_durations.append((name, dur, p_start, p_end))
+        # Everything below is fixed for the session's lifetime, so format it once
+        category_title = _CATEGORY_TITLES.get(category) or category.replace("_", " ").title()
+        fix_approach = _FIX_APPROACHES.get(
+            category,
+            "Apply security best practices to remediate the identified vulnerability",
+        )
+        files_modified = tuple(
+            t.format(
+                service=service.replace("-service", ""),
+                cls=finding_id.replace("-", ""),
+            )
+            for t in _FILE_TEMPLATES.get(category, ["src/main/fix.java"])[:2]
+        )
+        step_messages = {
+            stage: template.format(
+                finding_id=finding_id,
+                category_title=category_title,
+                service=service,
+                fix_approach=fix_approach,
+            )
+            for stage, template in _STEP_MSG_TEMPLATES.items()
+        }
+
+        # Cumulative stage end times (randomized durations within spec ranges),
+        # so polls can bisect straight to the active stage
+        cum_ends = tuple(itertools.accumulate(randoms["durations"]))
 
         self._sessions[session_id] = {
             "session_id": session_id,
-            "created_at": time.time(),
+            "created_at": time.time(),  # wall clock, for display only
+            "created_at_monotonic": time.monotonic(),
             "will_fail": will_fail,
-            "stage_durations": stage_durations,
+            "_cum_ends": cum_ends,
             "prompt": prompt,
             "playbook_id": playbook_id,
-            "tags": tags or [],
+            "tags": frozenset(tags or ()),
+            "_seq": len(self._sessions),
             "finding_id": finding_id,
             "category": category,
             "service": service,
+            "title": f"Remediate {finding_id}: {category_title}",
+            "fix_approach": fix_approach,
+            "files_modified": files_modified,
+            "step_messages": step_messages,
             "terminated": False,
+            "_random": randoms,
+            # (stage, progress, error) -> last response built for that key
+            "_cached_response": None,
         }
+        self._prompt_index.setdefault(prompt, session_id)
+        for tag in tags or ():
+            self._tag_index[tag].add(session_id)
 
         logger.info(
             "Mock session created: %s (will_fail=%s, finding=%s)",
@@ -168,8 +261,10 @@ class MockDevinClient:
 
     async def get_session(self, session_id: str) -> dict[str, Any]:
         """Return current state computed from elapsed time since creation."""
-        state = self._sessions[session_id]
+        return self._compute_state(self._sessions[session_id])
 
+    def _compute_state(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Synchronously compute the API response for a session state dict."""
         # Handle terminated sessions
         if state.get("terminated"):
             return self._build_response(
@@ -180,33 +275,12 @@ class MockDevinClient:
                 error="Session terminated by user",
             )
 
-        elapsed = time.time() - state["created_at"]
-        stage_durations: list[tuple[str, float, int, int]] = state["stage_durations"]
-
-        cumulative = 0.0
-        current_stage = "completed"
-        current_progress = 100
-        stage_frac = 1.0
-
-        for name, dur, p_start, p_end in stage_durations:
-            if elapsed < cumulative + dur:
-                # We're in this stage
-                stage_frac = (elapsed - cumulative) / dur
-                current_progress = int(p_start + stage_frac * (p_end - p_start))
-                current_stage = name
-
-                # If this session will fail and we've reached the testing stage
-                if state["will_fail"] and name == "testing":
-                    return self._build_response(
-                        state,
-                        stage="failed",
-                        progress=p_start,
-                        status_enum="blocked",
-                        error="Tests failed: existing tests broke after applying fix",
-                    )
-                break
-            cumulative += dur
-        else:
+        elapsed = time.monotonic() - state["created_at_monotonic"]
+        cum_ends: tuple[float, ...] = state["_cum_ends"]
+
+        # Index of the first stage whose cumulative end lies past `elapsed`
+        idx = bisect.bisect_right(cum_ends, elapsed)
+        if idx == len(cum_ends):
             # All stages completed
             if state["will_fail"]:
                 return self._build_response(
@@ -218,6 +292,23 @@ class MockDevinClient:
                 )
             current_stage = "completed"
             current_progress = 100
+        else:
+            name, p_start, p_end = _STAGE_INFO[idx]
+
+            # If this session will fail and we've reached the testing stage
+            if state["will_fail"] and name == "testing":
+                return self._build_response(
+                    state,
+                    stage="failed",
+                    progress=p_start,
+                    status_enum="blocked",
+                    error="Tests failed: existing tests broke after applying fix",
+                )
+
+            stage_start = cum_ends[idx - 1] if idx else 0.0
+            stage_frac = (elapsed - stage_start) / (cum_ends[idx] - stage_start)
+            current_progress = int(p_start + stage_frac * (p_end - p_start))
+            current_stage = name
 
         if current_stage == "completed":
             return self._build_response(
@@ -243,8 +334,18 @@ class MockDevinClient:
         status_enum: str,
         error: str | None = None,
     ) -> dict[str, Any]:
-        """Build a mock Devin API response dict."""
+        """Build a mock Devin API response dict.
+
+        The last response is cached on the session state and returned as-is
+        while the (stage, progress, error) key is unchanged.
+        """
+        key = (stage, progress, error)
+        cached = state["_cached_response"]
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         finding_id = state["finding_id"]
+        randoms = state["_random"]
         category = state["category"]
         service = state["service"]
 
@@ -256,56 +357,35 @@ class MockDevinClient:
         confidence: str | None = None
 
         # Populate fields based on stage progression
-        stage_order = ["analyzing", "fixing", "testing", "creating_pr", "completed", "failed"]
-        stage_idx = stage_order.index(stage) if stage in stage_order else 0
+        stage_idx = _STAGE_INDEX.get(stage, 0)
 
         if stage_idx >= 1 or stage == "failed":
             # Past analyzing -> have fix_approach and confidence
-            fix_approach = _FIX_APPROACHES.get(
-                category,
-                "Apply security best practices to remediate the identified vulnerability",
-            )
-            confidence = self._rng.choice(["high", "medium"]) if category != "other" else "low"
+            fix_approach = state["fix_approach"]
+            confidence = randoms["confidence"] if category != "other" else "low"
 
         if stage_idx >= 2 or (stage == "failed"):
             # Past fixing -> have files_modified
-            templates = _FILE_TEMPLATES.get(category, ["src/main/fix.java"])
-            files_modified = [
-                t.format(
-                    service=service.replace("-service", ""),
-                    cls=finding_id.replace("-", ""),
-                )
-                for t in templates[:2]
-            ]
+            files_modified = list(state["files_modified"])
 
         if stage_idx >= 3:
             # Past testing -> have test results
             tests_passed = True
-            tests_added = self._rng.randint(1, 5)
+            tests_added = randoms["tests_added"]
 
         if stage == "failed":
             tests_passed = False
             tests_added = 0
 
         if stage in ("creating_pr", "completed"):
-            pr_number = self._rng.randint(10, 999)
+            pr_number = randoms["pr_number"]
             pr_url = f"https://github.com/coupang-demo/{service}/pull/{pr_number}"
 
-        # Current step messages
-        step_messages = {
-            "analyzing": f"Analyzing finding {finding_id}: {category.replace('_', ' ').title()} in {service}",
-            "fixing": f"Applying fix for {finding_id} — {fix_approach or 'patching vulnerability'}",
-            "testing": f"Running test suite — validating fix for {finding_id}",
-            "creating_pr": f"Creating pull request with fix for {finding_id}",
-            "completed": "Pull request created successfully",
-            "failed": "Tests failed after applying fix",
-        }
-
         structured_output = {
             "finding_id": finding_id,
             "status": stage,
             "progress_pct": progress,
-            "current_step": step_messages.get(stage, "Processing..."),
+            "current_step": state["step_messages"].get(stage, "Processing..."),
             "fix_approach": fix_approach,
             "files_modified": files_modified,
             "tests_passed": tests_passed,
@@ -319,14 +399,16 @@ class MockDevinClient:
         if stage == "completed" and pr_url:
             pull_request = {"url": pr_url}
 
-        return {
+        response = {
             "session_id": state["session_id"],
             "status_enum": status_enum,
             "url": f"https://app.devin.ai/sessions/{state['session_id']}",
-            "title": f"Remediate {finding_id}: {category.replace('_', ' ').title()}",
+            "title": state["title"],
             "structured_output": structured_output,
             "pull_request": pull_request,
         }
+        state["_cached_response"] = (key, response)
+        return response
 
     async def list_sessions(
         self,
@@ -335,20 +417,21 @@ class MockDevinClient:
         offset: int = 0,
     ) -> dict[str, Any]:
         """List sessions, optionally filtered by tags."""
-        all_sessions = list(self._sessions.values())
-
         if tags:
-            tag_set = set(tags)
-            all_sessions = [
-                s for s in all_sessions if tag_set.issubset(set(s.get("tags", [])))
-            ]
+            candidates = set.intersection(
+                *(self._tag_index.get(t, set()) for t in tags)
+            )
+            all_sessions = sorted(
+                (self._sessions[sid] for sid in candidates),
+                key=lambda s: s["_seq"],
+            )
+        else:
+            all_sessions = list(self._sessions.values())
 
         total = len(all_sessions)
         page = all_sessions[offset : offset + limit]
 
-        sessions_out = []
-        for s in page:
-            sessions_out.append(await self.get_session(s["session_id"]))
+        sessions_out = [self._compute_state(s) for s in page]
 
         return {"sessions": sessions_out, "total": total}
 
@@ -364,7 +447,7 @@ class MockDevinClient:
 
     async def create_playbook(self, title: str, body: str) -> dict[str, Any]:
         """Store and return a fake playbook_id."""
-        playbook_id = f"pb-mock-{uuid.uuid4().hex[:8]}"
+        playbook_id = self._new_id("pb-mock-", self._playbooks)
         self._playbooks[playbook_id] = {
             "playbook_id": playbook_id,
             "title": title,
@@ -385,6 +468,12 @@ class MockDevinClient:
         """No-op — mock client has no circuit breaker."""
         pass
 
+    async def __aenter__(self) -> MockDevinClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
     async def close(self) -> None:
         """No-op — nothing to clean up."""
         pass
@@ -1,3 +1,5 @@
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from pydantic import Field, field_validator
@@ -17,9 +19,9 @@ class _CsvListParseMixin:
     def prepare_field_value(
         self, field_name: str, field: Any, value: Any, value_is_complex: bool
     ) -> Any:
-        if field_name in self._CSV_LIST_FIELDS and isinstance(value, str):
-            return [v.strip() for v in value.split(",") if v.strip()] if value else []
-        return super().prepare_field_value(field_name, field, value, value_is_complex)  # type: ignore[misc]
+        if field_name not in self._CSV_LIST_FIELDS or not isinstance(value, str):
+            return super().prepare_field_value(field_name, field, value, value_is_complex)  # type: ignore[misc]
+        return [v.strip() for v in value.split(",") if v.strip()]
 
 
 class _CsvAwareEnvSource(_CsvListParseMixin, EnvSettingsSource):
@@ -52,6 +54,19 @@ class OrchestratorConfig(BaseSettings):
     circuit_breaker_cooldown_seconds: int = 30
     max_retries: int = 3
     retry_jitter_max_seconds: float = 1.0
+    max_concurrent_creates: int = 3
+    max_poll_concurrency: int = 8
+    http_connection_limit: int = 64
+    http_keepalive_timeout_seconds: float = 75.0
+
+    # Push updates: Devin POSTs session changes to a local webhook server.
+    # A non-empty webhook_url enables the server, which then requires
+    # webhook_secret (create_webhook_app refuses to start without one).
+    webhook_url: str = ""
+    webhook_secret: str = ""
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8787
+    webhook_fallback_poll_seconds: int = 60
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -71,18 +86,34 @@ class OrchestratorConfig(BaseSettings):
         dotenv_settings: Any,
         file_secret_settings: Any,
     ) -> tuple[Any, ...]:
-        return (
+        env_file_encoding = settings_cls.model_config.get("env_file_encoding")
+        sources: list[Any] = [
             init_settings,
             _CsvAwareEnvSource(settings_cls),
             _CsvAwareDotEnvSource(
                 settings_cls,
                 env_file=settings_cls.model_config.get("env_file"),
-                env_file_encoding=settings_cls.model_config.get("env_file_encoding"),
+                env_file_encoding=env_file_encoding,
             ),
-            _CsvAwareDotEnvSource(
-                settings_cls,
-                env_file=".env.local",
-                env_file_encoding=settings_cls.model_config.get("env_file_encoding"),
-            ),
-            file_secret_settings,
-        )
+        ]
+        # .env.local is optional; skip building (and reading) the source when absent
+        if Path(".env.local").is_file():
+            sources.append(
+                _CsvAwareDotEnvSource(
+                    settings_cls,
+                    env_file=".env.local",
+                    env_file_encoding=env_file_encoding,
+                )
+            )
+        sources.append(file_secret_settings)
+        return tuple(sources)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> OrchestratorConfig:
+    """Return the process-wide config, reading env / .env files only once.
+
+    Callers that need to mutate settings (e.g. CLI flag overrides) should
+    work on ``get_config().model_copy()``.
+    """
+    return OrchestratorConfig()
@@ -4,14 +4,27 @@ import asyncio
 import logging
 import random
 import time as _time
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import aiohttp
 
+from orchestrator.utils import json_dumps_bytes, json_loads
+
 logger = logging.getLogger(__name__)
 
 _RETRYABLE_STATUSES = {429, 500, 502, 503}
 
+# Exponential backoff base delays (seconds) indexed by attempt; clamps at the last entry
+_BACKOFF_TABLE: tuple[float, ...] = (1.0, 2.0, 4.0, 8.0, 16.0, 32.0)
+
+# Connection pool / concurrency tuning for heavy polling
+_CONNECTOR_LIMIT = 64
+_CONNECTOR_LIMIT_PER_HOST = 32
+_DNS_CACHE_TTL_SECONDS = 300
+_KEEPALIVE_TIMEOUT_SECONDS = 75
+_MAX_INFLIGHT_REQUESTS = 32
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
+
 
 class DevinAPIError(Exception):
     """Raised on non-2xx responses from the Devin API."""
@@ -59,13 +72,95 @@ class CircuitBreaker:
         self._state = "closed"
 
     def check(self) -> None:
-        """Raise CircuitBreakerOpen if circuit is open."""
-        state = self.state
-        if state == "open":
+        """Raise CircuitBreakerOpen if circuit is open.
+
+        Called before every request, so the closed/half-open fast path avoids
+        reading the clock; only an open breaker checks its cooldown.
+        """
+        if self._state != "open":
+            # closed, or half_open: allow one probe through (don't raise)
+            return
+        if _time.monotonic() - self._last_failure_time < self._cooldown:
             raise CircuitBreakerOpen(
                 f"Circuit breaker is open (cooldown {self._cooldown}s remaining)"
             )
-        # half_open: allow one probe through (don't raise)
+        self._state = "half_open"
+
+
+class _GetSessionBatcher:
+    """Coalesces get_session calls issued within a short window into one batch.
+
+    The v1 API has no multi-id GET, so each batch is fanned out as concurrent
+    single-session GETs over the shared connection pool. Duplicate session ids
+    within a window share a single request.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[Any]],
+        max_batch: int = 32,
+        max_wait_ms: float = 20,
+    ) -> None:
+        self._fetch = fetch
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, session_id: str) -> Any:
+        """Queue a fetch for session_id and wait for its batch to resolve."""
+        fut = self._pending.get(session_id)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut = loop.create_future()
+            self._pending[session_id] = fut
+            if len(self._pending) >= self._max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._max_wait, self._flush)
+        # Shield so one cancelled caller doesn't cancel the shared future
+        return await asyncio.shield(fut)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future[Any]]) -> None:
+        try:
+            results = await asyncio.gather(
+                *(self._fetch(sid) for sid in batch), return_exceptions=True
+            )
+            for fut, result in zip(batch.values(), results):
+                if fut.done():
+                    continue
+                if isinstance(result, BaseException):
+                    fut.set_exception(result)
+                else:
+                    fut.set_result(result)
+        finally:
+            # If the batch was cancelled mid-flight, release its waiters
+            for fut in batch.values():
+                if not fut.done():
+                    fut.cancel()
+
+    def cancel(self) -> None:
+        """Drop any queued or in-flight batches."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for fut in self._pending.values():
+            fut.cancel()
+        self._pending = {}
+        for task in self._tasks:
+            task.cancel()
 
 
 class DevinClient:
@@ -79,6 +174,8 @@ class DevinClient:
         retry_jitter_max: float = 1.0,
         circuit_breaker_threshold: int = 5,
         circuit_breaker_cooldown: int = 30,
+        connection_limit: int = _CONNECTOR_LIMIT,
+        keepalive_timeout: float = _KEEPALIVE_TIMEOUT_SECONDS,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
@@ -88,16 +185,34 @@ class DevinClient:
             threshold=circuit_breaker_threshold,
             cooldown_seconds=circuit_breaker_cooldown,
         )
+        self._connection_limit = connection_limit
+        self._keepalive_timeout = keepalive_timeout
         self._session: aiohttp.ClientSession | None = None
+        # Caps concurrent in-flight HTTP requests (retry backoff sleeps don't hold a slot)
+        self._inflight = asyncio.Semaphore(_MAX_INFLIGHT_REQUESTS)
+        self._batcher = _GetSessionBatcher(self._fetch_session)
+        self._rng = random.Random()
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Lazily create the aiohttp session."""
+        """Lazily create the aiohttp session.
+
+        One pooled session lives for the client's lifetime (until close()),
+        so keep-alive connections are reused across every request in a run.
+        """
         if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                limit_per_host=min(_CONNECTOR_LIMIT_PER_HOST, self._connection_limit),
+                ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=self._keepalive_timeout,
+            )
             self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=_REQUEST_TIMEOUT,
                 headers={
                     "Authorization": f"Bearer {self._api_key}",
                     "Content-Type": "application/json",
-                }
+                },
             )
         return self._session
 
@@ -111,57 +226,67 @@ class DevinClient:
         self._circuit_breaker.check()
         session = await self._ensure_session()
         url = f"{self._base_url}{path}"
+        # Encode JSON bodies once, with orjson when available, instead of
+        # letting aiohttp run stdlib json.dumps on every attempt
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps_bytes(kwargs.pop("json"))
         last_status = 0
 
         for attempt in range(self._max_retries + 1):
+            wait: float | None = None
+            backoff = _BACKOFF_TABLE[min(attempt, len(_BACKOFF_TABLE) - 1)]
             try:
-                async with session.request(method, url, **kwargs) as resp:
+                async with self._inflight, session.request(method, url, **kwargs) as resp:
                     last_status = resp.status
 
                     if resp.status in _RETRYABLE_STATUSES and attempt < self._max_retries:
                         # Retry-After header takes precedence
                         retry_after = resp.headers.get("Retry-After")
+                        wait = backoff
                         if retry_after:
                             try:
                                 wait = min(float(retry_after), 60.0)
                             except ValueError:
-                                wait = float(2 ** attempt)
-                        else:
-                            wait = float(2 ** attempt)
+                                pass
                         # Add jitter
-                        wait += random.uniform(0, self._retry_jitter_max)
+                        wait += self._rng.random() * self._retry_jitter_max
                         logger.warning(
                             "Retryable error %d on %s %s, retrying in %.1fs (attempt %d/%d)",
                             resp.status, method, path, wait, attempt + 1, self._max_retries,
                         )
-                        await asyncio.sleep(wait)
-                        continue
-
-                    if resp.status >= 400:
+                    elif resp.status >= 400:
                         body = await resp.text()
                         self._circuit_breaker.record_failure()
                         raise DevinAPIError(resp.status, body)
-
-                    # Success
-                    self._circuit_breaker.record_success()
-                    if resp.status == 204 or resp.content_length == 0:
-                        return {}
-                    try:
-                        return await resp.json()
-                    except (aiohttp.ContentTypeError, Exception):
-                        return {}
+                    else:
+                        # Success
+                        self._circuit_breaker.record_success()
+                        if resp.status == 204 or resp.content_length == 0:
+                            return {}
+                        # Decode raw bytes directly rather than via resp.json()'s
+                        # text round-trip through stdlib json
+                        body_bytes = await resp.read()
+                        if not body_bytes:
+                            return {}
+                        try:
+                            return json_loads(body_bytes)
+                        except ValueError:
+                            return {}
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
                 self._circuit_breaker.record_failure()
                 if attempt < self._max_retries:
-                    wait = float(2 ** attempt) + random.uniform(0, self._retry_jitter_max)
+                    wait = backoff + self._rng.random() * self._retry_jitter_max
                     logger.warning(
                         "Network error on %s %s: %s, retrying in %.1fs",
                         method, path, exc, wait,
                     )
-                    await asyncio.sleep(wait)
-                    continue
-                raise DevinAPIError(0, str(exc)) from exc
+                else:
+                    raise DevinAPIError(0, str(exc)) from exc
+
+            # Back off outside the response context so the connection and
+            # in-flight slot are released while we wait
+            await asyncio.sleep(wait)
 
         self._circuit_breaker.record_failure()
         raise DevinAPIError(last_status, f"Retryable error after {self._max_retries} retries")
@@ -174,30 +299,54 @@ class DevinClient:
         structured_output_schema: dict[str, Any] | None = None,
         max_acu_limit: int | None = None,
         idempotent: bool = True,
+        structured_output_schema_json: str | None = None,
+        webhook_url: str | None = None,
     ) -> dict[str, Any]:
         """POST /v1/sessions — create a new Devin session.
 
+        structured_output_schema_json, when given, is the schema already
+        encoded as JSON; it is spliced into the request body as-is and takes
+        precedence over structured_output_schema. webhook_url, when given,
+        asks Devin to POST session state changes there.
+
         Returns: {"session_id": str, "url": str, "is_new_session": bool}
         """
-        body: dict[str, Any] = {"prompt": prompt}
-        if playbook_id is not None:
-            body["playbook_id"] = playbook_id
-        if tags is not None:
-            body["tags"] = tags
-        if structured_output_schema is not None:
-            body["structured_output_schema"] = structured_output_schema
-        if max_acu_limit is not None:
-            body["max_acu_limit"] = max_acu_limit
-        body["idempotent"] = idempotent
-
-        return await self._request("POST", "/sessions", json=body)
+        if structured_output_schema_json is not None:
+            structured_output_schema = None
+        body: dict[str, Any] = {
+            k: v
+            for k, v in (
+                ("prompt", prompt),
+                ("playbook_id", playbook_id),
+                ("tags", tags),
+                ("structured_output_schema", structured_output_schema),
+                ("max_acu_limit", max_acu_limit),
+                ("idempotent", idempotent),
+                ("webhook_url", webhook_url),
+            )
+            if v is not None
+        }
+
+        if structured_output_schema_json is None:
+            return await self._request("POST", "/sessions", json=body)
+
+        # body always holds "prompt", so the encoded object is never empty
+        encoded = json_dumps_bytes(body)
+        payload = b"%s,\"structured_output_schema\":%s}" % (
+            encoded[:-1],
+            structured_output_schema_json.encode(),
+        )
+        return await self._request("POST", "/sessions", data=payload)
 
     async def get_session(self, session_id: str) -> dict[str, Any]:
         """GET /v1/sessions/{session_id} — get full session details.
 
         Returns session details including status_enum, structured_output,
-        and pull_request.
+        and pull_request. Concurrent calls are coalesced by the batcher.
         """
+        return await self._batcher.submit(session_id)
+
+    async def _fetch_session(self, session_id: str) -> dict[str, Any]:
         return await self._request("GET", f"/sessions/{session_id}")
 
     async def list_sessions(
@@ -210,9 +359,11 @@ class DevinClient:
 
         Returns: list or {"sessions": [...], "total": int}
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if tags:
-            params["tags"] = ",".join(tags)
+        params: dict[str, Any] = (
+            {"limit": limit, "offset": offset, "tags": ",".join(tags)}
+            if tags
+            else {"limit": limit, "offset": offset}
+        )
         return await self._request("GET", "/sessions", params=params)
 
     async def send_message(self, session_id: str, message: str) -> None:
@@ -261,8 +412,15 @@ class DevinClient:
         """Reset the circuit breaker to closed state. Call after cleanup operations."""
         self._circuit_breaker.reset()
 
+    async def __aenter__(self) -> DevinClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
     async def close(self) -> None:
         """Close the underlying aiohttp session. Safe to call multiple times."""
+        self._batcher.cancel()
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
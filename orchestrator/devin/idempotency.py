@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
-from orchestrator.utils import atomic_write_json
+from orchestrator.utils import atomic_write_bytes, json_dumps_bytes, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -15,17 +16,25 @@ class IdempotencyLedger:
 
     Keys: "{run_id}-{finding_id}-attempt-{attempt}"
     Values: {"session_id": str, "created_at": str}
+
+    Writes are debounced: record() persists at most once per flush_interval
+    seconds. Call flush() at checkpoint boundaries (end of dispatch, shutdown)
+    to persist any buffered entries.
     """
 
-    def __init__(self, ledger_path: str | Path) -> None:
+    def __init__(self, ledger_path: str | Path, flush_interval: float = 1.0) -> None:
         self._path = Path(ledger_path)
         self._entries: dict[str, dict[str, Any]] = {}
+        self._flush_interval = flush_interval
+        self._dirty = False
+        self._last_flush = float("-inf")  # first record() always writes through
         self._load()
 
     def _load(self) -> None:
         if self._path.exists():
             try:
-                self._entries = json.loads(self._path.read_text(encoding="utf-8"))
+                self._entries = json_loads(self._path.read_bytes())
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             except (json.JSONDecodeError, OSError):
                 logger.warning(
                     "Could not load idempotency ledger at %s, starting fresh",
@@ -35,7 +44,14 @@ class IdempotencyLedger:
 
     def _save(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_json(self._path, self._entries)
+        atomic_write_bytes(self._path, json_dumps_bytes(self._entries, indent=True))
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Persist buffered entries to disk if anything changed since the last write."""
+        if self._dirty:
+            self._save()
 
     def make_key(self, run_id: str, finding_id: str, attempt: int) -> str:
         return f"{run_id}-{finding_id}-attempt-{attempt}"
@@ -48,5 +64,7 @@ class IdempotencyLedger:
             "session_id": session_id,
             "created_at": created_at,
         }
-        self._save()
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self._save()
         logger.debug("Idempotency recorded: %s -> %s", key, session_id)
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 from typing import Any
 
 from orchestrator.config import OrchestratorConfig
+from orchestrator.memory.retriever import retrieve_memories, retrieve_memories_batch
+from orchestrator.memory.store import MemoryStore
 from orchestrator.models import (
     Finding,
     FindingCategory,
     RemediationSession,
     SessionStatus,
 )
+from orchestrator.utils import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +47,104 @@ REMEDIATION_OUTPUT_SCHEMA: dict[str, Any] = {
     "required": ["finding_id", "status", "progress_pct", "current_step"],
 }
 
+# Encoded once at import; clients that accept it send this instead of
+# re-serializing the schema for every session create
+REMEDIATION_OUTPUT_SCHEMA_JSON: str = json.dumps(REMEDIATION_OUTPUT_SCHEMA, sort_keys=True)
+
+# (path, st_mtime_ns, st_size) -> parsed overrides from the last successful load
+_overrides_cache: tuple[tuple[str, int, int], dict[str, Any]] | None = None
+
 
 def load_service_overrides() -> dict[str, Any]:
-    """Load service overrides from service_overrides.json. Returns empty dict on failure."""
+    """Load service overrides from service_overrides.json. Returns empty dict on failure.
+
+    The parsed file is cached and only re-read when its mtime or size changes.
+    Callers must treat the returned dict as read-only.
+    """
+    global _overrides_cache
     try:
-        if _SERVICE_OVERRIDES_PATH.exists():
-            return json.loads(_SERVICE_OVERRIDES_PATH.read_text(encoding="utf-8"))
+        st = _SERVICE_OVERRIDES_PATH.stat()
+    except FileNotFoundError:
+        return {}
+    except OSError as exc:
+        logger.warning("Could not load service overrides: %s", exc)
+        return {}
+
+    key = (str(_SERVICE_OVERRIDES_PATH), st.st_mtime_ns, st.st_size)
+    if _overrides_cache is not None and _overrides_cache[0] == key:
+        return _overrides_cache[1]
+
+    try:
+        overrides = json_loads(_SERVICE_OVERRIDES_PATH.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Could not load service overrides: %s", exc)
-    return {}
+        return {}
+    _overrides_cache = (key, overrides)
+    return overrides
+
+
+# Prompt sections, compiled once; build_remediation_prompt joins the ones that apply
+_BASE_TMPL = Template("""## Security Remediation Task
+
+**Run ID**: $run_id
+**Finding ID**: $finding_id
+**Service**: $service_name
+**Category**: $category
+**Severity**: $severity
+**File**: $file_path
+**Line**: $line
+**CWE**: $cwe
+
+**Title**: $title
+
+**Description**: $description
+""")
+
+_DEP_TMPL = Template("""
+**Dependency**: $dep
+**Current Version**: $cur_ver
+**Fixed Version**: $fix_ver
+""")
+
+_INSTRUCTIONS_TMPL = Template("""
+## Instructions
+1. Clone the repository at $repo_url
+2. Fix the vulnerability described above following the playbook instructions
+3. Update structured output after each major step (analyzing, fixing, testing, creating_pr, completed)
+4. Run existing tests and ensure they pass
+5. Create a pull request with the fix on a new branch
+""")
+
+_OVERRIDES_TMPL = Template("""
+## Service-Specific Instructions ($service_name)
+- **Test Command**: $test_command
+- **Branch Prefix**: $branch_prefix
+- **Deployment Notes**: $deployment_notes
+
+$custom_instructions
+""")
+
+_MEMORY_TMPL = Template("""
+## Prior Remediation Knowledge
+The following context is from previous remediation sessions for similar findings.
+Use this as reference but verify applicability to the current codebase.
+
+$memory_context
+""")
+
+
+@lru_cache(maxsize=8)
+def _prompt_template(has_dep: bool, has_overrides: bool, has_memory: bool) -> Template:
+    """Return one precombined Template per prompt shape (which optional sections appear)."""
+    sections = [_BASE_TMPL]
+    if has_dep:
+        sections.append(_DEP_TMPL)
+    sections.append(_INSTRUCTIONS_TMPL)
+    if has_overrides:
+        sections.append(_OVERRIDES_TMPL)
+    if has_memory:
+        sections.append(_MEMORY_TMPL)
+    return Template("".join(t.template for t in sections))
 
 
 def build_remediation_prompt(
@@ -59,67 +154,46 @@ def build_remediation_prompt(
     run_id: str = "",
 ) -> str:
     """Construct the session prompt from a Finding, optionally enriched with memory and service overrides."""
-    line = str(finding.line_number) if finding.line_number is not None else "N/A"
-    cwe = finding.cwe_id or "N/A"
-
-    prompt = f"""## Security Remediation Task
-
-**Run ID**: {run_id}
-**Finding ID**: {finding.finding_id}
-**Service**: {finding.service_name}
-**Category**: {finding.category.value}
-**Severity**: {finding.severity.value}
-**File**: {finding.file_path}
-**Line**: {line}
-**CWE**: {cwe}
-
-**Title**: {finding.title}
-
-**Description**: {finding.description}
-"""
-
-    if finding.category == FindingCategory.DEPENDENCY_VULNERABILITY:
-        dep = finding.dependency_name or "N/A"
-        cur_ver = finding.current_version or "N/A"
-        fix_ver = finding.fixed_version or "N/A"
-        prompt += f"""
-**Dependency**: {dep}
-**Current Version**: {cur_ver}
-**Fixed Version**: {fix_ver}
-"""
-
-    prompt += f"""
-## Instructions
-1. Clone the repository at {finding.repo_url}
-2. Fix the vulnerability described above following the playbook instructions
-3. Update structured output after each major step (analyzing, fixing, testing, creating_pr, completed)
-4. Run existing tests and ensure they pass
-5. Create a pull request with the fix on a new branch
-"""
+    fields: dict[str, str] = {
+        "run_id": run_id,
+        "finding_id": finding.finding_id,
+        "service_name": finding.service_name,
+        "category": finding.category.value,
+        "severity": finding.severity.value,
+        "file_path": finding.file_path,
+        "line": str(finding.line_number) if finding.line_number is not None else "N/A",
+        "cwe": finding.cwe_id or "N/A",
+        "title": finding.title,
+        "description": finding.description,
+        "repo_url": finding.repo_url,
+    }
+
+    has_dep = finding.category == FindingCategory.DEPENDENCY_VULNERABILITY
+    if has_dep:
+        fields["dep"] = finding.dependency_name or "N/A"
+        fields["cur_ver"] = finding.current_version or "N/A"
+        fields["fix_ver"] = finding.fixed_version or "N/A"
 
     # Add service overrides section if applicable
-    if service_overrides:
-        overrides = service_overrides.get(finding.service_name)
-        if overrides:
-            prompt += f"""
-## Service-Specific Instructions ({finding.service_name})
-- **Test Command**: {overrides.get('test_command', 'N/A')}
-- **Branch Prefix**: {overrides.get('branch_prefix', 'security/fix')}
-- **Deployment Notes**: {overrides.get('deployment_notes', 'Standard deployment.')}
-
-{overrides.get('custom_instructions', '')}
-"""
+    overrides = service_overrides.get(finding.service_name) if service_overrides else None
+    if overrides:
+        fields["test_command"] = overrides.get("test_command", "N/A")
+        fields["branch_prefix"] = overrides.get("branch_prefix", "security/fix")
+        fields["deployment_notes"] = overrides.get("deployment_notes", "Standard deployment.")
+        fields["custom_instructions"] = overrides.get("custom_instructions", "")
 
     if memory_context:
-        prompt += f"""
-## Prior Remediation Knowledge
-The following context is from previous remediation sessions for similar findings.
-Use this as reference but verify applicability to the current codebase.
+        fields["memory_context"] = memory_context
+
+    # One substitution over the precombined template for this shape; values
+    # are never re-scanned, so "$" inside them is left as-is
+    return _prompt_template(has_dep, bool(overrides), bool(memory_context)).substitute(fields)
 
-{memory_context}
-"""
 
-    return prompt
+@lru_cache(maxsize=8)
+def _get_memory_store(memory_dir: str) -> MemoryStore:
+    """Return a process-wide MemoryStore per memory_dir instead of one per finding."""
+    return MemoryStore(memory_dir)
 
 
 def build_memory_context(
@@ -130,19 +204,9 @@ def build_memory_context(
     Returns None if no relevant memories found.
     """
     try:
-        from orchestrator.memory.retriever import retrieve_memories
-        from orchestrator.memory.store import MemoryStore
-
-        store = MemoryStore(memory_dir)
+        store = _get_memory_store(memory_dir)
         memories = retrieve_memories(finding, store, max_results=3)
-        if not memories:
-            return None
-
-        parts: list[str] = []
-        for mem in memories:
-            parts.append(f"### {mem['source_note']}\n\n{mem['content']}")
-
-        return "\n---\n\n".join(parts)
+        return _format_memory_context(memories)
     except Exception as exc:
         logger.warning(
             "Could not retrieve memories for %s: %s", finding.finding_id, exc
@@ -150,6 +214,50 @@ def build_memory_context(
         return None
 
 
+def build_memory_contexts(
+    findings: list[Finding], memory_dir: str = "orchestrator/memory"
+) -> dict[str, str | None]:
+    """Build memory context strings for many findings with one store traversal.
+
+    Returns a dict keyed by finding_id; values are None where no relevant
+    memories were found (or retrieval failed).
+    """
+    try:
+        store = _get_memory_store(memory_dir)
+        memories_by_id = retrieve_memories_batch(findings, store, max_results=3)
+    except Exception as exc:
+        logger.warning("Could not retrieve memories for wave: %s", exc)
+        return {f.finding_id: None for f in findings}
+    return {
+        finding_id: _format_memory_context(memories)
+        for finding_id, memories in memories_by_id.items()
+    }
+
+
+def _format_memory_context(memories: list[dict[str, Any]]) -> str | None:
+    if not memories:
+        return None
+
+    parts: list[str] = []
+    for mem in memories:
+        parts.append(f"### {mem['source_note']}\n\n{mem['content']}")
+
+    return "\n---\n\n".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _match_connected_repo(repos: tuple[str, ...], service_name: str) -> str | None:
+    """Return the first repo that matches service_name in either direction.
+
+    A wave holds many findings but only a handful of services, so the
+    repo scan runs once per (repo list, service) pair instead of per finding.
+    """
+    for repo in repos:
+        if service_name in repo or repo in service_name:
+            return repo
+    return None
+
+
 def determine_data_source(
     finding: Finding,
     config: OrchestratorConfig,
@@ -165,17 +273,27 @@ def determine_data_source(
     if not config.hybrid_mode:
         return "live"
     # Hybrid: check if service repo is connected
-    for repo in config.connected_repos:
-        if finding.service_name in repo or repo in finding.service_name:
-            logger.info(
-                "Hybrid routing: %s → live (matched repo %s)",
-                finding.finding_id, repo,
-            )
-            return "live"
+    repo = _match_connected_repo(tuple(config.connected_repos), finding.service_name)
+    if repo is not None:
+        logger.info(
+            "Hybrid routing: %s → live (matched repo %s)",
+            finding.finding_id, repo,
+        )
+        return "live"
     logger.info("Hybrid routing: %s → mock (no repo match)", finding.finding_id)
     return "mock"
 
 
+# Sentinel: create_remediation_session should look up memory context itself
+_MEMORY_NOT_PROVIDED: Any = object()
+
+
+def _utc_now() -> tuple[datetime, str]:
+    """Return the current UTC time and its ISO 8601 form from one clock read."""
+    now = datetime.now(timezone.utc)
+    return now, now.isoformat()
+
+
 async def create_remediation_session(
     client: Any,  # DevinClient or MockDevinClient
     session: RemediationSession,
@@ -183,10 +301,16 @@ async def create_remediation_session(
     data_source: str = "mock",
     ledger: Any | None = None,  # IdempotencyLedger
     run_id: str = "",
+    memory_context: Any = _MEMORY_NOT_PROVIDED,  # str | None
 ) -> RemediationSession:
-    """Create a Devin session for a remediation task."""
+    """Create a Devin session for a remediation task.
+
+    Pass memory_context (from build_memory_contexts) to skip the per-finding
+    memory lookup; None means "no relevant memories".
+    """
     try:
         # Check idempotency ledger first
+        key = None
         if ledger is not None and run_id:
             key = ledger.make_key(run_id, session.finding.finding_id, session.attempt)
             existing = ledger.lookup(key)
@@ -201,10 +325,11 @@ async def create_remediation_session(
                 return session
 
         overrides = load_service_overrides()
-        memory_ctx = build_memory_context(session.finding)
+        if memory_context is _MEMORY_NOT_PROVIDED:
+            memory_context = build_memory_context(session.finding)
         prompt = build_remediation_prompt(
             session.finding,
-            memory_context=memory_ctx,
+            memory_context=memory_context,
             service_overrides=overrides,
             run_id=run_id,
         )
@@ -222,22 +347,19 @@ async def create_remediation_session(
             structured_output_schema=REMEDIATION_OUTPUT_SCHEMA,
             max_acu_limit=config.max_acu_per_session,
             idempotent=True,
+            structured_output_schema_json=REMEDIATION_OUTPUT_SCHEMA_JSON,
+            webhook_url=config.webhook_url or None,
         )
 
         session.session_id = response["session_id"]
         session.devin_url = response.get("url")
         session.status = SessionStatus.DISPATCHED
         session.data_source = data_source
-        session.created_at = datetime.now(timezone.utc)
+        session.created_at, created_at_iso = _utc_now()
 
         # Record in idempotency ledger after successful creation
-        if ledger is not None and run_id:
-            key = ledger.make_key(run_id, session.finding.finding_id, session.attempt)
-            ledger.record(
-                key,
-                session.session_id,
-                session.created_at.isoformat() if session.created_at else "",
-            )
+        if key is not None:
+            ledger.record(key, session.session_id, created_at_iso)
 
         logger.info(
             "Created session %s for finding %s",
@@ -256,6 +378,39 @@ async def create_remediation_session(
     return session
 
 
+async def create_remediation_sessions(
+    dispatches: list[tuple[Any, RemediationSession, str]],
+    config: OrchestratorConfig,
+    ledger: Any | None = None,  # IdempotencyLedger
+    run_id: str = "",
+    memory_contexts: dict[str, str | None] | None = None,
+) -> list[RemediationSession]:
+    """Create Devin sessions for (client, session, data_source) triples concurrently.
+
+    At most config.max_concurrent_creates creates are in flight at once.
+    Failures are recorded on each session by create_remediation_session, so
+    one failed create never cancels the others.  Returns the sessions in
+    the order given.
+    """
+    sem = asyncio.Semaphore(max(1, config.max_concurrent_creates))
+
+    async def _create(client: Any, session: RemediationSession, data_source: str) -> None:
+        kwargs: dict[str, Any] = {}
+        if memory_contexts is not None:
+            kwargs["memory_context"] = memory_contexts.get(session.finding.finding_id)
+        async with sem:
+            await create_remediation_session(
+                client, session, config, data_source,
+                ledger=ledger, run_id=run_id, **kwargs,
+            )
+
+    async with asyncio.TaskGroup() as tg:
+        for client, session, data_source in dispatches:
+            tg.create_task(_create(client, session, data_source))
+
+    return [session for _, session, _ in dispatches]
+
+
 _STATUS_MAP: dict[str, SessionStatus] = {
     "working": SessionStatus.WORKING,
     "finished": SessionStatus.SUCCESS,
@@ -267,6 +422,8 @@ _STATUS_MAP: dict[str, SessionStatus] = {
     "resumed": SessionStatus.WORKING,
 }
 
+_WARNED_UNKNOWN_STATUSES: set[str] = set()
+
 
 def interpret_session_status(api_response: dict[str, Any]) -> tuple[SessionStatus, str | None, str | None]:
     """Map Devin API response to our SessionStatus enum.
@@ -297,11 +454,15 @@ def interpret_session_status(api_response: dict[str, Any]) -> tuple[SessionStatu
         return SessionStatus.SUCCESS, pr_url, error_message
 
     # Map known statuses; default to WORKING for unknown values to keep polling
-    status = _STATUS_MAP.get(status_enum, SessionStatus.WORKING)
-    if status_enum and status_enum not in _STATUS_MAP:
-        logger.warning(
-            "Unknown Devin status_enum '%s' — treating as WORKING (will keep polling)",
-            status_enum,
-        )
+    status = _STATUS_MAP.get(status_enum)
+    if status is None:
+        status = SessionStatus.WORKING
+        # Warn once per unknown value; it repeats on every poll otherwise
+        if status_enum and status_enum not in _WARNED_UNKNOWN_STATUSES:
+            _WARNED_UNKNOWN_STATUSES.add(status_enum)
+            logger.warning(
+                "Unknown Devin status_enum '%s' — treating as WORKING (will keep polling)",
+                status_enum,
+            )
 
     return status, pr_url, error_message
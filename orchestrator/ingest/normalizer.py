@@ -1,17 +1,21 @@
 import logging
+from operator import attrgetter
 
-from orchestrator.models import Finding, Severity
+from orchestrator.models import Finding
 
 logger = logging.getLogger(__name__)
 
-# Severity ranking for comparison (higher = more severe)
+# Severity ranking for comparison (higher = more severe), keyed by enum value
 _SEVERITY_RANK = {
-    Severity.CRITICAL: 4,
-    Severity.HIGH: 3,
-    Severity.MEDIUM: 2,
-    Severity.LOW: 1,
+    "critical": 4,
+    "high": 3,
+    "medium": 2,
+    "low": 1,
 }
 
+# Builds the dedup key tuple in a single C-level call
+_dedup_key = attrgetter("service_name", "file_path", "line_number", "category.value")
+
 
 def normalize_findings(findings: list[Finding]) -> list[Finding]:
     """Deduplicate and validate findings.
@@ -22,29 +26,30 @@ def normalize_findings(findings: list[Finding]) -> list[Finding]:
 
     Returns deduplicated findings preserving original order (of kept items).
     """
-    seen: dict[tuple[str, str, int | None, str], int] = {}
-    result: list[Finding] = []
+    # Dicts keep insertion order, and re-assigning an existing key keeps its
+    # slot, so a higher-severity replacement stays where the original was.
+    kept: dict[tuple[str, str, int | None, str], Finding] = {}
+    rank = _SEVERITY_RANK.__getitem__  # local alias for the hot loop
+    kept_get = kept.get
 
     for finding in findings:
-        key = (finding.service_name, finding.file_path, finding.line_number, finding.category.value)
-
-        if key not in seen:
-            seen[key] = len(result)
-            result.append(finding)
-        else:
-            existing_idx = seen[key]
-            existing = result[existing_idx]
-            if _SEVERITY_RANK[finding.severity] > _SEVERITY_RANK[existing.severity]:
-                result[existing_idx] = finding
-                logger.debug(
-                    "Replaced %s (%s) with %s (%s) for dedup key %s",
-                    existing.finding_id,
-                    existing.severity.value,
-                    finding.finding_id,
-                    finding.severity.value,
-                    key,
-                )
-
+        key = _dedup_key(finding)
+
+        existing = kept_get(key)
+        if existing is None:
+            kept[key] = finding
+        elif rank(finding.severity.value) > rank(existing.severity.value):
+            kept[key] = finding
+            logger.debug(
+                "Replaced %s (%s) with %s (%s) for dedup key %s",
+                existing.finding_id,
+                existing.severity.value,
+                finding.finding_id,
+                finding.severity.value,
+                key,
+            )
+
+    result = list(kept.values())
     duplicates_removed = len(findings) - len(result)
     if duplicates_removed > 0:
         logger.info("Removed %d duplicate findings", duplicates_removed)
@@ -1,17 +1,18 @@
 import csv
+import io
 import logging
+import sys
 from pathlib import Path
 
 from orchestrator.models import Finding, FindingCategory, Severity
 
 logger = logging.getLogger(__name__)
 
-# Pre-compute valid enum values for fast lookup
-_VALID_CATEGORIES = {e.value for e in FindingCategory}
-_VALID_SEVERITIES = {e.value for e in Severity}
+# Map raw cell values straight to enum members: one lookup both validates
+# the value and yields the member, skipping the Enum constructor per row
+_CATEGORY_BY_VALUE = {e.value: e for e in FindingCategory}
+_SEVERITY_BY_VALUE = {e.value: e for e in Severity}
 
-# Optional fields that should map "" -> None
-_OPTIONAL_FIELDS = {"cwe_id", "dependency_name", "current_version", "fixed_version", "language", "line_number"}
 
 
 def parse_findings_csv(file_path: str) -> list[Finding]:
@@ -30,53 +31,94 @@ def parse_findings_csv(file_path: str) -> list[Finding]:
     findings: list[Finding] = []
     path = Path(file_path)
 
+    # Read the export in one call and tokenize from memory rather than
+    # pulling it through the file object line by line
     with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(io.StringIO(f.read()))
+        header = next(reader, None)
+        if header is None:
+            logger.info("Parsed 0 findings from %s", file_path)
+            return findings
+        idx = {name: i for i, name in enumerate(header)}
+        width = len(header)
+
+        # finding_id, scanner, title, description, service_name, repo_url and
+        # file_path are required: a missing column raises KeyError just as
+        # row["..."] did with DictReader
+        i_id = idx["finding_id"]
+        i_scanner = idx["scanner"]
+        i_title = idx["title"]
+        i_desc = idx["description"]
+        i_service = idx["service_name"]
+        i_repo = idx["repo_url"]
+        i_path = idx["file_path"]
+        # Other columns may be absent from the header entirely; point them
+        # at a padding cell that is always "". A missing category or severity
+        # then fails validation, so each row is warned about and skipped.
+        i_cat = idx.get("category", width)
+        i_sev = idx.get("severity", width)
+        i_line = idx.get("line_number", width)
+        i_cwe = idx.get("cwe_id", width)
+        i_dep = idx.get("dependency_name", width)
+        i_cur = idx.get("current_version", width)
+        i_fix = idx.get("fixed_version", width)
+        i_lang = idx.get("language", width)
+        pad = [""] * (width + 1)
+        to_int = int
+        intern = sys.intern
+        category_for = _CATEGORY_BY_VALUE.get
+        severity_for = _SEVERITY_BY_VALUE.get
+
         for row in reader:
-            finding_id = row.get("finding_id", "unknown")
+            if not row:
+                continue  # DictReader skipped blank lines too
+            if len(row) <= width:
+                # Short rows (and the padding cell) read as empty cells
+                row.extend(pad[len(row) :])
 
             # Validate category
-            raw_category = row.get("category", "")
-            if raw_category not in _VALID_CATEGORIES:
-                logger.warning("Skipping %s: invalid category '%s'", finding_id, raw_category)
+            category = category_for(row[i_cat])
+            if category is None:
+                logger.warning("Skipping %s: invalid category '%s'", row[i_id] or "unknown", row[i_cat])
                 continue
 
             # Validate severity
-            raw_severity = row.get("severity", "")
-            if raw_severity not in _VALID_SEVERITIES:
-                logger.warning("Skipping %s: invalid severity '%s'", finding_id, raw_severity)
+            severity = severity_for(row[i_sev])
+            if severity is None:
+                logger.warning("Skipping %s: invalid severity '%s'", row[i_id] or "unknown", row[i_sev])
                 continue
 
-            # Map empty strings to None for optional fields
-            for field in _OPTIONAL_FIELDS:
-                if row.get(field, "") == "":
-                    row[field] = None
-
             # Convert line_number to int or None
-            ln = row.get("line_number")
-            if ln is not None:
+            ln = row[i_line]
+            if ln:
                 try:
-                    row["line_number"] = int(ln)
-                except (ValueError, TypeError):
-                    row["line_number"] = None
+                    line_number = to_int(ln)
+                except ValueError:
+                    line_number = None
+            else:
+                line_number = None
 
             findings.append(
                 Finding(
-                    finding_id=row["finding_id"],
-                    scanner=row["scanner"],
-                    category=FindingCategory(raw_category),
-                    severity=Severity(raw_severity),
-                    title=row["title"],
-                    description=row["description"],
-                    service_name=row["service_name"],
-                    repo_url=row["repo_url"],
-                    file_path=row["file_path"],
-                    line_number=row["line_number"],
-                    cwe_id=row.get("cwe_id"),
-                    dependency_name=row.get("dependency_name"),
-                    current_version=row.get("current_version"),
-                    fixed_version=row.get("fixed_version"),
-                    language=row.get("language"),
+                    finding_id=row[i_id],
+                    # Interned: a handful of scanners and languages repeat
+                    # across every row of an export
+                    scanner=intern(row[i_scanner]),
+                    category=category,
+                    severity=severity,
+                    title=row[i_title],
+                    description=row[i_desc],
+                    # Interned: these repeat across rows and key the dedup,
+                    # scoring and routing lookups downstream
+                    service_name=intern(row[i_service]),
+                    repo_url=intern(row[i_repo]),
+                    file_path=intern(row[i_path]),
+                    line_number=line_number,
+                    cwe_id=row[i_cwe] or None,
+                    dependency_name=row[i_dep] or None,
+                    current_version=row[i_cur] or None,
+                    fixed_version=row[i_fix] or None,
+                    language=intern(row[i_lang]) or None,
                     priority_score=0.0,
                 )
             )
@@ -1,32 +1,72 @@
-from orchestrator.models import Finding, FindingCategory, Severity
+import heapq
+import sys
+from operator import attrgetter
 
-_SEVERITY_WEIGHTS: dict[Severity, float] = {
-    Severity.CRITICAL: 40.0,
-    Severity.HIGH: 30.0,
-    Severity.MEDIUM: 15.0,
-    Severity.LOW: 5.0,
+from orchestrator.models import Finding
+
+# Weight tables are keyed by enum value so lookups hash a plain str
+_SEVERITY_WEIGHTS: dict[str, float] = {
+    "critical": 40.0,
+    "high": 30.0,
+    "medium": 15.0,
+    "low": 5.0,
 }
 
-_CATEGORY_WEIGHTS: dict[FindingCategory, float] = {
-    FindingCategory.SQL_INJECTION: 25.0,
-    FindingCategory.HARDCODED_SECRET: 25.0,
-    FindingCategory.DEPENDENCY_VULNERABILITY: 20.0,
-    FindingCategory.XSS: 20.0,
-    FindingCategory.PATH_TRAVERSAL: 20.0,
-    FindingCategory.PII_LOGGING: 15.0,
-    FindingCategory.MISSING_ENCRYPTION: 15.0,
-    FindingCategory.ACCESS_LOGGING: 10.0,
-    FindingCategory.OTHER: 10.0,
+_CATEGORY_WEIGHTS: dict[str, float] = {
+    "sql_injection": 25.0,
+    "hardcoded_secret": 25.0,
+    "dependency_vulnerability": 20.0,
+    "xss": 20.0,
+    "path_traversal": 20.0,
+    "pii_logging": 15.0,
+    "missing_encryption": 15.0,
+    "access_logging": 10.0,
+    "other": 10.0,
 }
 
+# Keys interned to match the interned service_name strings from the parser
 _SERVICE_WEIGHTS: dict[str, float] = {
-    "payment-service": 20.0,
-    "user-service": 15.0,
-    "auth-service": 20.0,
-    "catalog-service": 10.0,
+    sys.intern(k): v
+    for k, v in {
+        "payment-service": 20.0,
+        "user-service": 15.0,
+        "auth-service": 20.0,
+        "catalog-service": 10.0,
+    }.items()
 }
 _DEFAULT_SERVICE_WEIGHT: float = 10.0
 
+# Severity + category weight per (severity, category) pair, so scoring a
+# finding costs one table lookup plus the service lookup.
+_BASE_WEIGHTS: dict[tuple[str, str], float] = {
+    (sev, cat): sev_w + cat_w
+    for sev, sev_w in _SEVERITY_WEIGHTS.items()
+    for cat, cat_w in _CATEGORY_WEIGHTS.items()
+}
+
+# (severity, category, service) of a finding, read in one C-level call
+_score_key = attrgetter("severity.value", "category.value", "service_name")
+
+
+def _score_findings(findings: list[Finding]) -> list[float]:
+    """Compute and store priority_score on each finding; return the scores."""
+    # Reduce each finding to its (severity, category, service) code, score
+    # each distinct code once, then map the codes to scores. The per-finding
+    # work is C-level map() calls; only the distinct codes (a few dozen at
+    # most) are scored in Python.
+    keys = list(map(_score_key, findings))
+    base = _BASE_WEIGHTS
+    service_weight = _SERVICE_WEIGHTS.get
+    default = _DEFAULT_SERVICE_WEIGHT
+    table = {
+        key: base[key[0], key[1]] + service_weight(key[2], default)
+        for key in set(keys)
+    }
+    scores = list(map(table.__getitem__, keys))
+    for f, score in zip(findings, scores):
+        f.priority_score = score
+    return scores
+
 
 def prioritize_findings(findings: list[Finding]) -> list[Finding]:
     """Score and sort findings by priority (highest first).
@@ -38,11 +78,19 @@ def prioritize_findings(findings: list[Finding]) -> list[Finding]:
     objects see the computed scores.  Returns a NEW sorted list (the input
     list's order is not changed).
     """
-    for f in findings:
-        f.priority_score = (
-            _SEVERITY_WEIGHTS[f.severity]
-            + _CATEGORY_WEIGHTS[f.category]
-            + _SERVICE_WEIGHTS.get(f.service_name, _DEFAULT_SERVICE_WEIGHT)
-        )
-
-    return sorted(findings, key=lambda x: x.priority_score, reverse=True)
+    return prioritize_top_k(findings, len(findings))
+
+
+def prioritize_top_k(findings: list[Finding], k: int) -> list[Finding]:
+    """Score every finding and return only the ``k`` highest priority ones.
+
+    Same scoring and in-place mutation as prioritize_findings, and the same
+    order (ties keep input order).  Selecting with a heap costs O(N log k)
+    instead of a full O(N log N) sort when k is much smaller than N.
+    """
+    scores = _score_findings(findings)
+    if k >= len(findings):
+        order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    else:
+        order = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+    return [findings[i] for i in order]
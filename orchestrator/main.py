@@ -1,20 +1,27 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
-import signal
-import uuid
 from collections import Counter
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from orchestrator.config import OrchestratorConfig
+from orchestrator.utils import json_loads
+
+# Heavier imports (pydantic-settings config, asyncio, clients) are deferred
+# into the commands that use them to keep CLI startup fast
+if TYPE_CHECKING:
+    from orchestrator.config import OrchestratorConfig
+    from orchestrator.models import BatchRun
 
 logger = logging.getLogger(__name__)
 
+_SEVERITY_CATEGORY = attrgetter("severity.value", "category.value")
+
 
 def _setup_logging(verbose: bool = False) -> None:
     """Configure logging. INFO by default, DEBUG if verbose."""
@@ -33,16 +40,23 @@ def _get_client(config: OrchestratorConfig):
 
         return MockDevinClient()
     else:
-        from orchestrator.devin.client import DevinClient
-
-        return DevinClient(
-            api_key=config.devin_api_key,
-            base_url=config.devin_api_base_url,
-            max_retries=config.max_retries,
-            retry_jitter_max=config.retry_jitter_max_seconds,
-            circuit_breaker_threshold=config.circuit_breaker_threshold,
-            circuit_breaker_cooldown=config.circuit_breaker_cooldown_seconds,
-        )
+        return _make_devin_client(config)
+
+
+def _make_devin_client(config: OrchestratorConfig):
+    """Build the live DevinClient; it keeps one pooled HTTP session per run."""
+    from orchestrator.devin.client import DevinClient
+
+    return DevinClient(
+        api_key=config.devin_api_key,
+        base_url=config.devin_api_base_url,
+        max_retries=config.max_retries,
+        retry_jitter_max=config.retry_jitter_max_seconds,
+        circuit_breaker_threshold=config.circuit_breaker_threshold,
+        circuit_breaker_cooldown=config.circuit_breaker_cooldown_seconds,
+        connection_limit=config.http_connection_limit,
+        keepalive_timeout=config.http_keepalive_timeout_seconds,
+    )
 
 
 def _ingest_findings(csv_path: str):
@@ -71,33 +85,41 @@ def ingest(csv_path: str) -> None:
     findings = _ingest_findings(csv_path)
 
     # Summary
-    click.echo(f"\n{'='*60}")
-    click.echo(f"  Ingestion Summary")
-    click.echo(f"{'='*60}")
-    click.echo(f"  Total findings: {len(findings)}")
+    out: list[str] = []
+    out.append(f"\n{'='*60}")
+    out.append(f"  Ingestion Summary")
+    out.append(f"{'='*60}")
+    out.append(f"  Total findings: {len(findings)}")
+
+    # Count (severity, category) pairs in one pass, then fold per axis
+    pair_counts = Counter(map(_SEVERITY_CATEGORY, findings))
+    severity_counts: Counter[str] = Counter()
+    category_counts: Counter[str] = Counter()
+    for (sev, cat), count in pair_counts.items():
+        severity_counts[sev] += count
+        category_counts[cat] += count
 
     # Per-severity counts
-    severity_counts = Counter(f.severity.value for f in findings)
-    click.echo(f"\n  By severity:")
+    out.append(f"\n  By severity:")
     for sev in ["critical", "high", "medium", "low"]:
         count = severity_counts.get(sev, 0)
-        click.echo(f"    {sev.upper():12s} {count}")
+        out.append(f"    {sev.upper():12s} {count}")
 
     # Per-category counts
-    category_counts = Counter(f.category.value for f in findings)
-    click.echo(f"\n  By category:")
+    out.append(f"\n  By category:")
     for cat, count in category_counts.most_common():
-        click.echo(f"    {cat:30s} {count}")
+        out.append(f"    {cat:30s} {count}")
 
     # Top 5 by priority
-    click.echo(f"\n  Top 5 by priority:")
+    out.append(f"\n  Top 5 by priority:")
     for f in findings[:5]:
-        click.echo(
+        out.append(
             f"    [{f.priority_score:5.1f}] {f.finding_id} | {f.severity.value:8s} | "
             f"{f.category.value:30s} | {f.service_name}"
         )
 
-    click.echo(f"{'='*60}\n")
+    out.append(f"{'='*60}\n")
+    click.echo("\n".join(out))
 
 
 @cli.command()
@@ -105,30 +127,33 @@ def ingest(csv_path: str) -> None:
 @click.option("--wave-size", default=None, type=int, help="Findings per wave (overrides config)")
 def plan(csv_path: str, wave_size: int | None) -> None:
     """Generate wave-based remediation plan."""
+    from orchestrator.config import get_config
     from orchestrator.planner.batch_planner import create_waves
 
-    config = OrchestratorConfig()
+    config = get_config()
     findings = _ingest_findings(csv_path)
     effective_wave_size = wave_size or config.wave_size
     waves = create_waves(findings, effective_wave_size)
 
-    click.echo(f"\n{'='*60}")
-    click.echo(f"  Remediation Plan")
-    click.echo(f"{'='*60}")
-    click.echo(f"  Total findings: {len(findings)}")
-    click.echo(f"  Wave size: {effective_wave_size}")
-    click.echo(f"  Number of waves: {len(waves)}")
+    out: list[str] = []
+    out.append(f"\n{'='*60}")
+    out.append(f"  Remediation Plan")
+    out.append(f"{'='*60}")
+    out.append(f"  Total findings: {len(findings)}")
+    out.append(f"  Wave size: {effective_wave_size}")
+    out.append(f"  Number of waves: {len(waves)}")
 
     for wave in waves:
-        click.echo(f"\n  Wave {wave.wave_number} ({len(wave.sessions)} findings):")
+        out.append(f"\n  Wave {wave.wave_number} ({len(wave.sessions)} findings):")
         for session in wave.sessions:
             f = session.finding
-            click.echo(
+            out.append(
                 f"    {f.finding_id} | [{f.priority_score:5.1f}] {f.severity.value:8s} | "
                 f"{f.category.value:30s} | {f.service_name}"
             )
 
-    click.echo(f"\n{'='*60}\n")
+    out.append(f"\n{'='*60}\n")
+    click.echo("\n".join(out))
 
 
 async def _run_pipeline(
@@ -147,6 +172,7 @@ async def _run_pipeline(
     from orchestrator.planner.playbook_selector import assign_playbooks, ensure_playbooks_uploaded
     from orchestrator.planner.wave_manager import WaveManager
 
+    webhook_runner = None
     try:
         # Preflight checks (skip if no findings passed, e.g., for backward compat)
         if findings is not None:
@@ -161,6 +187,12 @@ async def _run_pipeline(
         waves = assign_playbooks(waves, playbook_ids)
         batch_run.waves = waves  # Update with assigned playbooks
 
+        # Receive pushed session updates; polling stays on as a safety net
+        if config.webhook_url:
+            from orchestrator.monitor.webhook import start_webhook_server
+
+            webhook_runner = await start_webhook_server(tracker, config)
+
         # Execute
         manager = WaveManager(
             client, config, tracker,
@@ -171,6 +203,8 @@ async def _run_pipeline(
         )
         return await manager.execute_run(batch_run)
     finally:
+        if webhook_runner is not None:
+            await webhook_runner.cleanup()
         await client.close()
         if mock_client is not None:
             await mock_client.close()
@@ -185,10 +219,15 @@ async def _run_pipeline(
 @click.option("--hybrid", is_flag=True, help="Hybrid mode: real for connected repos, mock for others")
 def run(csv_path: str, wave_size: int | None, wave_num: int | None, dry_run: bool, live: bool, hybrid: bool) -> None:
     """Full pipeline: ingest -> plan -> dispatch -> monitor."""
+    import asyncio
+    import secrets
+    import signal
+
+    from orchestrator.config import get_config
     from orchestrator.monitor.tracker import ProgressTracker
     from orchestrator.planner.batch_planner import create_waves
 
-    config = OrchestratorConfig()
+    config = get_config().model_copy()
 
     # Override config based on CLI flags
     if live:
@@ -207,15 +246,7 @@ def run(csv_path: str, wave_size: int | None, wave_num: int | None, dry_run: boo
     mock_client = None
     if config.hybrid_mode:
         from mock.mock_devin_client import MockDevinClient
-        from orchestrator.devin.client import DevinClient
-        client = DevinClient(
-            api_key=config.devin_api_key,
-            base_url=config.devin_api_base_url,
-            max_retries=config.max_retries,
-            retry_jitter_max=config.retry_jitter_max_seconds,
-            circuit_breaker_threshold=config.circuit_breaker_threshold,
-            circuit_breaker_cooldown=config.circuit_breaker_cooldown_seconds,
-        )
+        client = _make_devin_client(config)
         mock_client = MockDevinClient()
     else:
         client = _get_client(config)
@@ -230,7 +261,7 @@ def run(csv_path: str, wave_size: int | None, wave_num: int | None, dry_run: boo
     # Create BatchRun
     from orchestrator.models import BatchRun
 
-    run_id = str(uuid.uuid4())[:8]
+    run_id = secrets.token_hex(4)
     total_findings = sum(len(w.sessions) for w in waves)
 
     batch_run = BatchRun(
@@ -257,16 +288,18 @@ def run(csv_path: str, wave_size: int | None, wave_num: int | None, dry_run: boo
 
     # Dry run
     if dry_run:
-        click.echo("  DRY RUN — showing what would be dispatched:\n")
+        out: list[str] = []
+        out.append("  DRY RUN — showing what would be dispatched:\n")
         for wave in waves:
-            click.echo(f"  Wave {wave.wave_number}:")
+            out.append(f"  Wave {wave.wave_number}:")
             for session in wave.sessions:
                 f = session.finding
-                click.echo(
+                out.append(
                     f"    {f.finding_id} | {f.category.value:30s} | {f.severity.value:8s} | "
                     f"{f.service_name:20s} | playbook={session.playbook_id}"
                 )
-        click.echo(f"\n{'='*60}\n")
+        out.append(f"\n{'='*60}\n")
+        click.echo("\n".join(out))
         asyncio.run(client.close())
         if mock_client is not None:
             asyncio.run(mock_client.close())
@@ -311,6 +344,8 @@ def run(csv_path: str, wave_size: int | None, wave_num: int | None, dry_run: boo
             raise
     finally:
         signal.signal(signal.SIGINT, original_handler)
+        ledger.flush()
+        tracker.close()
 
     # Auto-extract memories
     try:
@@ -321,26 +356,15 @@ def run(csv_path: str, wave_size: int | None, wave_num: int | None, dry_run: boo
         logger.warning("Memory extraction failed: %s", exc)
 
     # Print final summary
-    click.echo(f"\n{'='*60}")
-    click.echo(f"  Run complete: {batch_run.successful}/{batch_run.total_findings} succeeded, "
-               f"{batch_run.prs_created} PRs created")
-    click.echo(f"  Failed: {batch_run.failed}, Status: {batch_run.status}")
-    for wave in batch_run.waves:
-        prs = sum(1 for s in wave.sessions if s.pr_url is not None)
-        click.echo(
-            f"    Wave {wave.wave_number}: {wave.success_count}/{wave.total_count} success, "
-            f"{wave.failure_count} failed, {prs} PRs"
-        )
-    click.echo(f"{'='*60}\n")
+    _print_run_summary(batch_run)
 
 
 @cli.command("extract-memory")
 @click.option("--run-id", default=None, help="Run ID to extract from (default: latest)")
 def extract_memory(run_id: str | None) -> None:
     """Extract memory items from a completed run."""
-    from orchestrator.memory.extractor import extract_memories
+    from orchestrator.memory.extractor import iter_memories
     from orchestrator.memory.store import MemoryStore
-    from orchestrator.models import BatchRun
 
     # Find the run
     if run_id:
@@ -351,7 +375,7 @@ def extract_memory(run_id: str | None) -> None:
         if not index_path.exists():
             click.echo("No runs found.")
             return
-        entries = json.loads(index_path.read_text(encoding="utf-8"))
+        entries = json_loads(index_path.read_bytes())
         if not entries:
             click.echo("No runs found.")
             return
@@ -362,76 +386,103 @@ def extract_memory(run_id: str | None) -> None:
         click.echo(f"Run {run_id} state file not found.")
         return
 
-    data = json.loads(state_path.read_text(encoding="utf-8"))
-    batch_run = BatchRun.model_validate(data)
-
-    items = extract_memories(batch_run)
-    if not items:
-        click.echo("No terminal sessions found — nothing to extract.")
-        return
+    batch_run = _load_batch_run(state_path)
 
     store = MemoryStore()
     graph = store.load_graph()
-    for item in items:
-        graph = store.upsert(item, graph)
+    count = store.upsert_many(iter_memories(batch_run), graph)
+    if not count:
+        click.echo("No terminal sessions found — nothing to extract.")
+        return
     store.save_graph(graph)
 
     click.echo(f"\n{'='*60}")
     click.echo(f"  Memory Extraction Complete")
     click.echo(f"{'='*60}")
     click.echo(f"  Run ID: {run_id}")
-    click.echo(f"  Items extracted: {len(items)}")
+    click.echo(f"  Items extracted: {count}")
     click.echo(f"  Graph entries: {len(graph.entries)}")
     click.echo(f"{'='*60}\n")
 
 
+def _load_batch_run(state_path: Path) -> "BatchRun":
+    """Load a BatchRun from a state file written by ProgressTracker.save_state.
+
+    The JSON is decoded with orjson when available and validated by
+    pydantic-core in one pass. Rebuilding nested models with model_construct
+    instead is ~3-4x slower for run state, since the Python-level
+    construction costs more than the Rust validator.
+    """
+    from orchestrator.models import BatchRun
+
+    return BatchRun.model_validate(json_loads(state_path.read_bytes()))
+
+
+def _print_run_summary(batch_run: object) -> None:
+    """Print the end-of-run summary for a BatchRun."""
+    out: list[str] = []
+    out.append(f"\n{'='*60}")
+    out.append(f"  Run complete: {batch_run.successful}/{batch_run.total_findings} succeeded, "
+               f"{batch_run.prs_created} PRs created")
+    out.append(f"  Failed: {batch_run.failed}, Status: {batch_run.status}")
+    for wave in batch_run.waves:
+        prs = sum(1 for s in wave.sessions if s.pr_url is not None)
+        out.append(
+            f"    Wave {wave.wave_number}: {wave.success_count}/{wave.total_count} success, "
+            f"{wave.failure_count} failed, {prs} PRs"
+        )
+    out.append(f"{'='*60}\n")
+    click.echo("\n".join(out))
+
+
 def _print_status(batch_run: object) -> None:
     """Print formatted status output for a BatchRun."""
     total = batch_run.total_findings
     completed = batch_run.completed
     pct = (completed / total * 100) if total > 0 else 0
 
-    click.echo(f"\n{'='*60}")
-    click.echo(f"  Run Status")
-    click.echo(f"{'='*60}")
-    click.echo(f"  Run ID:     {batch_run.run_id}")
-    click.echo(f"  Status:     {batch_run.status}")
-    click.echo(f"  Started:    {batch_run.started_at}")
-    click.echo(f"\n  Completed:  {completed}/{total} ({pct:.0f}%)")
-    click.echo(f"  Successful: {batch_run.successful}")
-    click.echo(f"  Failed:     {batch_run.failed}")
-    click.echo(f"  PRs:        {batch_run.prs_created}")
-
-    click.echo(f"\n  Waves:")
+    out: list[str] = []
+    out.append(f"\n{'='*60}")
+    out.append(f"  Run Status")
+    out.append(f"{'='*60}")
+    out.append(f"  Run ID:     {batch_run.run_id}")
+    out.append(f"  Status:     {batch_run.status}")
+    out.append(f"  Started:    {batch_run.started_at}")
+    out.append(f"\n  Completed:  {completed}/{total} ({pct:.0f}%)")
+    out.append(f"  Successful: {batch_run.successful}")
+    out.append(f"  Failed:     {batch_run.failed}")
+    out.append(f"  PRs:        {batch_run.prs_created}")
+
+    out.append(f"\n  Waves:")
     for wave in batch_run.waves:
         prs = sum(1 for s in wave.sessions if s.pr_url is not None)
-        click.echo(
+        out.append(
             f"    Wave {wave.wave_number} [{wave.status}]: "
             f"{wave.success_count}/{wave.total_count} success, "
             f"{wave.failure_count} failed, {prs} PRs"
         )
 
-    click.echo(f"{'='*60}\n")
+    out.append(f"{'='*60}\n")
+    click.echo("\n".join(out))
 
 
 @cli.command()
 def status() -> None:
     """Show current progress from state.json or latest run."""
-    from orchestrator.models import BatchRun
+    from orchestrator.config import get_config
 
-    config = OrchestratorConfig()
+    config = get_config()
 
     # Try runs/index.json first for latest run
     runs_index = Path("./runs/index.json")
     if runs_index.exists():
         try:
-            entries = json.loads(runs_index.read_text(encoding="utf-8"))
+            entries = json_loads(runs_index.read_bytes())
             if entries:
                 latest = entries[-1]
                 run_state = Path(f"./runs/{latest['run_id']}/state.json")
                 if run_state.exists():
-                    data = json.loads(run_state.read_text(encoding="utf-8"))
-                    batch_run = BatchRun.model_validate(data)
+                    batch_run = _load_batch_run(run_state)
                     _print_status(batch_run)
                     return
         except (json.JSONDecodeError, OSError):
@@ -442,8 +493,7 @@ def status() -> None:
     if not state_path.exists():
         click.echo("No active run found.")
         return
-    data = json.loads(state_path.read_text(encoding="utf-8"))
-    batch_run = BatchRun.model_validate(data)
+    batch_run = _load_batch_run(state_path)
     _print_status(batch_run)
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime, timezone
 
 from orchestrator.memory.models import MemoryItem
@@ -16,23 +17,27 @@ _TERMINAL_STATUSES = {
 }
 
 
-def extract_memories(batch_run: BatchRun) -> list[MemoryItem]:
-    """Extract memory items from all terminal sessions in a batch run.
+def iter_memories(batch_run: BatchRun) -> Iterator[MemoryItem]:
+    """Yield a memory item for each terminal session in a batch run.
 
-    Only extracts from sessions that have reached a terminal state
-    (success, failed, timeout, blocked).
+    Only sessions that have reached a terminal state (success, failed,
+    timeout, blocked) produce items. Items are built lazily, so callers can
+    stream them into the memory store without holding the whole run's worth.
     """
-    items: list[MemoryItem] = []
-
+    run_id = batch_run.run_id
     for wave in batch_run.waves:
         for session in wave.sessions:
             if session.status not in _TERMINAL_STATUSES:
                 continue
 
-            item = _session_to_memory(session, batch_run.run_id)
+            item = _session_to_memory(session, run_id)
             if item is not None:
-                items.append(item)
+                yield item
 
+
+def extract_memories(batch_run: BatchRun) -> list[MemoryItem]:
+    """Extract memory items from all terminal sessions in a batch run."""
+    items = list(iter_memories(batch_run))
     logger.info("Extracted %d memory items from run %s", len(items), batch_run.run_id)
     return items
 
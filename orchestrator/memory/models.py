@@ -1,17 +1,39 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from datetime import datetime
+from enum import IntEnum
+from typing import Any
+
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+
+class RelationType(IntEnum):
+    SAME_CATEGORY = 1
+    SAME_SERVICE = 2
+    SIMILAR_FIX = 3
 
 
 class MemoryRelationship(BaseModel):
     """A relationship between two memory items."""
 
     target_id: str
-    relation_type: str  # "same_category", "same_service", "similar_fix"
+    relation_type: RelationType
+
+    @field_validator("relation_type", mode="before")
+    @classmethod
+    def parse_legacy_relation_type(cls, v: Any) -> Any:
+        # Older graphs stored the type by name, e.g. "same_category"
+        if isinstance(v, str):
+            return RelationType.__members__.get(v.upper(), v)
+        return v
 
 
 class MemoryGraphEntry(BaseModel):
-    """Metadata-only entry in graph.json (no full content)."""
+    """Metadata-only entry in graph.json (no full content).
+
+    Relationships to other entries are not stored; they are derived on
+    demand by MemoryStore.relationships_for().
+    """
 
     item_id: str
     finding_id: str
@@ -24,7 +46,23 @@ class MemoryGraphEntry(BaseModel):
     fix_approach_summary: str | None = None
     created_at: str
     run_id: str
-    relationships: list[MemoryRelationship] = Field(default_factory=list)
+
+    # created_at as epoch seconds, parsed on first use (None if unparseable
+    # or timezone-naive, which the freshness decay skips)
+    _created_epoch: float | None = PrivateAttr(default=None)
+    _created_parsed: bool = PrivateAttr(default=False)
+
+    def created_epoch(self) -> float | None:
+        """Return created_at as epoch seconds, parsing it at most once."""
+        if not self._created_parsed:
+            try:
+                created = datetime.fromisoformat(self.created_at)
+            except (ValueError, TypeError):
+                created = None
+            if created is not None and created.tzinfo is not None:
+                self._created_epoch = created.timestamp()
+            self._created_parsed = True
+        return self._created_epoch
 
 
 class MemoryGraph(BaseModel):
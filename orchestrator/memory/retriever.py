@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import heapq
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any
 
 from orchestrator.memory.models import MemoryGraph, MemoryGraphEntry
@@ -38,19 +41,170 @@ def retrieve_memories(
     if not graph.entries:
         return []
 
-    scored: list[tuple[float, MemoryGraphEntry]] = []
+    projection = _project_entries(graph.entries, prefer_live)
+    results = _rank_memories(projection, finding, store, max_results, prefer_live, {})
+
+    logger.info(
+        "Retrieved %d memories for %s (category=%s, service=%s)",
+        len(results),
+        finding.finding_id,
+        finding.category.value,
+        finding.service_name,
+    )
+    return results
+
 
-    for entry in graph.entries:
-        score = _score_entry(entry, finding, prefer_live)
-        if score > 0:
-            scored.append((score, entry))
+def retrieve_memories_batch(
+    findings: list[Finding],
+    store: MemoryStore,
+    max_results: int = 3,
+    prefer_live: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Retrieve ranked memories for many findings with a single graph load.
 
-    # Sort by score descending
-    scored.sort(key=lambda x: x[0], reverse=True)
+    Item markdown shared between findings is read from disk only once.
+    Returns a dict keyed by finding_id (same result shape as retrieve_memories).
+    """
+    graph = store.load_graph()
+    if not graph.entries:
+        return {f.finding_id: [] for f in findings}
+
+    projection = _project_entries(graph.entries, prefer_live)
+    content_cache: dict[str, str | None] = {}
+    results = {
+        f.finding_id: _rank_memories(
+            projection, f, store, max_results, prefer_live, content_cache
+        )
+        for f in findings
+    }
+
+    logger.info(
+        "Retrieved memories for %d findings (%d with matches)",
+        len(findings),
+        sum(1 for r in results.values() if r),
+    )
+    return results
+
+
+class _EntryProjection:
+    """Column view of graph entries for scoring many findings against one graph.
+
+    Everything about an entry's score that does not depend on the finding
+    (confidence, live and success bonuses, freshness decay) is computed once
+    here. Category and service indexes narrow each finding down to the
+    entries that can pass the relevance gate.
+    """
+
+    __slots__ = ("entries", "by_category", "by_service", "severity", "bonus", "decay")
+
+    def __init__(
+        self,
+        entries: list[MemoryGraphEntry],
+        by_category: dict[str, list[int]],
+        by_service: dict[str, list[int]],
+        severity: list[str],
+        bonus: list[float],
+        decay: list[float],
+    ) -> None:
+        self.entries = entries
+        self.by_category = by_category
+        self.by_service = by_service
+        self.severity = severity
+        self.bonus = bonus
+        self.decay = decay
+
+
+def _project_entries(entries: list[MemoryGraphEntry], prefer_live: bool) -> _EntryProjection:
+    """Precompute the finding-independent parts of every entry's score."""
+    by_category: dict[str, list[int]] = defaultdict(list)
+    by_service: dict[str, list[int]] = defaultdict(list)
+    severity: list[str] = []
+    bonus: list[float] = []
+    decay: list[float] = []
+    now_epoch = datetime.now(timezone.utc).timestamp()
+
+    for pos, entry in enumerate(entries):
+        by_category[entry.category].append(pos)
+        by_service[entry.service_name].append(pos)
+        severity.append(entry.severity)
+
+        extra = 0.0
+        # Confidence bonus
+        if entry.confidence:
+            extra += _CONFIDENCE_SCORES.get(entry.confidence, 0.0)
+        # Live source bonus
+        if prefer_live and entry.data_source == "live":
+            extra += _LIVE_SOURCE_BONUS
+        # Success bonus (successful fixes are more useful)
+        if entry.outcome == "success":
+            extra += _SUCCESS_BONUS
+        bonus.append(extra)
+
+        decay.append(_freshness_multiplier(entry.created_epoch(), now_epoch))
+
+    return _EntryProjection(entries, by_category, by_service, severity, bonus, decay)
+
+
+def _freshness_multiplier(created_epoch: float | None, now_epoch: float) -> float:
+    """Score multiplier for an entry's age: 1.0 when fresh, down to 0.5."""
+    if created_epoch is None:
+        return 1.0  # Can't parse date, no decay applied
+    age_days = int((now_epoch - created_epoch) // 86400)
+    if age_days > 0:
+        decay = max(0.0, 1.0 - (age_days / _FRESHNESS_DECAY_DAYS))
+        return 0.5 + 0.5 * decay  # Decay reduces score by up to 50%
+    return 1.0
+
+
+def _rank_memories(
+    projection: _EntryProjection,
+    finding: Finding,
+    store: MemoryStore,
+    max_results: int,
+    prefer_live: bool,
+    content_cache: dict[str, str | None],
+) -> list[dict[str, Any]]:
+    """Score entries against a finding and load content for the top matches."""
+    category = finding.category.value
+    service = finding.service_name
+    severity = finding.severity.value
+    cat_hits = projection.by_category.get(category, ())
+    svc_hits = projection.by_service.get(service, ())
+
+    # Only entries matching category or service pass the relevance gate;
+    # visit them in graph order so ties rank as a full scan would
+    scored: list[tuple[float, MemoryGraphEntry]] = []
+    cat_set = set(cat_hits)
+    svc_set = set(svc_hits)
+    # Loop-invariant lookups bound to locals
+    entries = projection.entries
+    severities = projection.severity
+    bonus = projection.bonus
+    decay = projection.decay
+    append = scored.append
+    for pos in sorted(cat_set | svc_set):
+        score = 0.0
+        # Category match (strongest signal)
+        if pos in cat_set:
+            score += _CATEGORY_MATCH_SCORE
+        # Service match
+        if pos in svc_set:
+            score += _SERVICE_MATCH_SCORE
+        # Severity match (only applied after relevance gate)
+        if severities[pos] == severity:
+            score += _SEVERITY_MATCH_SCORE
+        score += bonus[pos]
+        score *= decay[pos]
+        append((score, entries[pos]))
+
+    # Top max_results by score, descending; same order as a stable full sort
+    top = heapq.nlargest(max_results, scored, key=itemgetter(0))
 
     results: list[dict[str, Any]] = []
-    for score, entry in scored[:max_results]:
-        content = store.load_item(entry.item_id)
+    for score, entry in top:
+        if entry.item_id not in content_cache:
+            content_cache[entry.item_id] = store.load_item(entry.item_id)
+        content = content_cache[entry.item_id]
         if content is None:
             continue
 
@@ -70,60 +224,5 @@ def retrieve_memories(
             }
         )
 
-    logger.info(
-        "Retrieved %d memories for %s (category=%s, service=%s)",
-        len(results),
-        finding.finding_id,
-        finding.category.value,
-        finding.service_name,
-    )
     return results
 
-
-def _score_entry(
-    entry: MemoryGraphEntry,
-    finding: Finding,
-    prefer_live: bool,
-) -> float:
-    """Score a memory entry's relevance to a finding."""
-    score = 0.0
-
-    # Category match (strongest signal)
-    if entry.category == finding.category.value:
-        score += _CATEGORY_MATCH_SCORE
-
-    # Service match
-    if entry.service_name == finding.service_name:
-        score += _SERVICE_MATCH_SCORE
-
-    # Zero relevance if neither category nor service matches
-    if score == 0:
-        return 0.0
-
-    # Severity match (only applied after relevance gate)
-    if entry.severity == finding.severity.value:
-        score += _SEVERITY_MATCH_SCORE
-
-    # Confidence bonus
-    if entry.confidence:
-        score += _CONFIDENCE_SCORES.get(entry.confidence, 0.0)
-
-    # Live source bonus
-    if prefer_live and entry.data_source == "live":
-        score += _LIVE_SOURCE_BONUS
-
-    # Success bonus (successful fixes are more useful)
-    if entry.outcome == "success":
-        score += _SUCCESS_BONUS
-
-    # Freshness decay
-    try:
-        created = datetime.fromisoformat(entry.created_at)
-        age_days = (datetime.now(timezone.utc) - created).days
-        if age_days > 0:
-            decay = max(0.0, 1.0 - (age_days / _FRESHNESS_DECAY_DAYS))
-            score *= 0.5 + 0.5 * decay  # Decay reduces score by up to 50%
-    except (ValueError, TypeError):
-        pass  # Can't parse date, no decay applied
-
-    return score
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import sys
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
 from orchestrator.memory.models import (
     MemoryGraph,
     MemoryGraphEntry,
     MemoryItem,
     MemoryRelationship,
+    RelationType,
+)
+from orchestrator.utils import (
+    atomic_write_bytes,
+    json_dumps_bytes,
+    json_loads,
+    with_file_lock,
 )
-from orchestrator.utils import atomic_write_json, with_file_lock
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_MEMORY_DIR = "orchestrator/memory"
 
+_MAX_WRITE_WORKERS = 8
+
+_UPSERT_BATCH_SIZE = 256
+
+_REQUIRED_ENTRY_FIELDS = tuple(
+    name for name, field in MemoryGraphEntry.model_fields.items() if field.is_required()
+)
+
 
 class MemoryStore:
     """Filesystem-backed memory store.
@@ -30,29 +51,129 @@ class MemoryStore:
         self._graph_path = self._dir / "graph.json"
         self._items_dir = self._dir / "items"
         self._items_dir.mkdir(parents=True, exist_ok=True)
+        # ((st_mtime_ns, st_size), graph) of the last graph.json read or written
+        self._cache: tuple[tuple[int, int], MemoryGraph] | None = None
+        # items/<file> name -> (blake2b digest, (mtime_ns, size)) last written/seen
+        self._item_digests: dict[str, tuple[bytes, tuple[int, int]]] = {}
+        # Position indexes over the graph most recently passed to upsert
+        self._index_graph: MemoryGraph | None = None
+        self._index: tuple[
+            dict[str, int], defaultdict[str, list[int]], defaultdict[str, list[int]]
+        ] = ({}, defaultdict(list), defaultdict(list))
 
     def load_graph(self) -> MemoryGraph:
-        """Load the memory graph from disk."""
-        if not self._graph_path.exists():
+        """Load the memory graph from disk.
+
+        The validated graph is cached against graph.json's (mtime_ns, size),
+        so repeat loads of an unchanged file skip JSON parsing and
+        validation. Each call gets its own graph and entries list; the entry
+        objects are shared, so replace entries (as upsert does) rather than
+        mutating them in place.
+        """
+        try:
+            st = self._graph_path.stat()
+        except OSError:
             return MemoryGraph()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._cache is not None and self._cache[0] == stamp:
+            return _copy_graph(self._cache[1])
         try:
-            data = json.loads(self._graph_path.read_text(encoding="utf-8"))
-            return MemoryGraph.model_validate(data)
+            data = json_loads(self._graph_path.read_bytes())
+            graph = _construct_graph(data)
         except (json.JSONDecodeError, OSError, Exception) as exc:
             logger.warning("Could not load memory graph: %s", exc)
             return MemoryGraph()
+        # Validation builds fresh str objects; intern the fields retrieval
+        # compares so equal values share one object across entries
+        intern = sys.intern
+        for e in graph.entries:
+            e.category = intern(e.category)
+            e.service_name = intern(e.service_name)
+            e.severity = intern(e.severity)
+        self._cache = (stamp, graph)
+        return _copy_graph(graph)
 
     def save_graph(self, graph: MemoryGraph) -> None:
         """Save the memory graph atomically with file lock."""
         with with_file_lock(self._graph_path):
-            atomic_write_json(self._graph_path, graph.model_dump(mode="json"))
+            atomic_write_bytes(
+                self._graph_path, json_dumps_bytes(graph.model_dump(mode="json"), indent=True)
+            )
+            st = self._graph_path.stat()
+        self._cache = ((st.st_mtime_ns, st.st_size), _copy_graph(graph))
+
+    def _graph_index(
+        self, graph: MemoryGraph
+    ) -> tuple[dict[str, int], defaultdict[str, list[int]], defaultdict[str, list[int]]]:
+        """Return (item_id -> position, category -> positions, service -> positions) for graph.
+
+        Built once per graph object and kept current by upsert; rebuilt if the
+        graph changes or its entries were resized behind upsert's back.
+        """
+        if self._index_graph is not graph or len(self._index[0]) != len(graph.entries):
+            pos_by_id: dict[str, int] = {}
+            by_category: defaultdict[str, list[int]] = defaultdict(list)
+            by_service: defaultdict[str, list[int]] = defaultdict(list)
+            for pos, e in enumerate(graph.entries):
+                pos_by_id.setdefault(e.item_id, pos)
+                by_category[e.category].append(pos)
+                by_service[e.service_name].append(pos)
+            self._index_graph = graph
+            self._index = (pos_by_id, by_category, by_service)
+        return self._index
 
     def save_item(self, item: MemoryItem) -> None:
         """Save a memory item as markdown."""
         md_path = self._items_dir / f"{item.item_id}.md"
-        content = _render_markdown(item)
-        md_path.write_text(content, encoding="utf-8")
-        logger.debug("Saved memory item %s", item.item_id)
+        if self._write_markdown(md_path, _render_markdown(item)):
+            logger.debug("Saved memory item %s", item.item_id)
+
+    def save_items(self, items: list[MemoryItem]) -> None:
+        """Save many memory items as markdown, overlapping the file writes.
+
+        Rendering happens up front; the writes are independent files, so they
+        are issued from a small thread pool instead of one after another.
+        """
+        if len(items) <= 1:
+            for item in items:
+                self.save_item(item)
+            return
+        rendered = [
+            (self._items_dir / f"{item.item_id}.md", _render_markdown(item)) for item in items
+        ]
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(rendered))) as pool:
+            # sum() re-raises the first write error, if any
+            written = sum(pool.map(lambda pc: self._write_markdown(*pc), rendered))
+        logger.debug("Saved %d memory items (%d unchanged)", written, len(rendered) - written)
+
+    def _write_markdown(self, md_path: Path, content: str) -> bool:
+        """Write content to md_path unless the file already holds it.
+
+        Returns True if the file was written. The digest and stat of each
+        file this store wrote or checked are remembered, so re-saving an
+        unchanged item costs a stat() instead of a read and a write.
+        """
+        data = content.encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        key = md_path.name
+        try:
+            st = md_path.stat()
+        except OSError:
+            st = None
+        if st is not None:
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self._item_digests.get(key) == (digest, stamp):
+                return False
+            try:
+                if md_path.read_bytes() == data:
+                    self._item_digests[key] = (digest, stamp)
+                    return False
+            except OSError:
+                pass
+        md_path.write_bytes(data)
+        st = md_path.stat()
+        self._item_digests[key] = (digest, (st.st_mtime_ns, st.st_size))
+        return True
 
     def load_item(self, item_id: str) -> str | None:
         """Load a memory item's markdown content. Returns None if not found."""
@@ -64,58 +185,143 @@ class MemoryStore:
         except OSError:
             return None
 
-    def upsert(self, item: MemoryItem, graph: MemoryGraph) -> MemoryGraph:
-        """Add or update a memory item in the graph and save the markdown."""
-        # Save markdown
-        self.save_item(item)
-
-        # Build graph entry (metadata only)
-        entry = MemoryGraphEntry(
-            item_id=item.item_id,
-            finding_id=item.finding_id,
-            category=item.category,
-            service_name=item.service_name,
-            severity=item.severity,
-            data_source=item.data_source,
-            outcome=item.outcome,
-            confidence=item.confidence,
-            fix_approach_summary=item.fix_approach[:100] if item.fix_approach else None,
-            created_at=item.created_at,
-            run_id=item.run_id,
-        )
-
-        # Build relationships to other items in the same category or service
-        for existing in graph.entries:
-            if existing.item_id == item.item_id:
+    def relationships_for(self, item_id: str, graph: MemoryGraph) -> list[MemoryRelationship]:
+        """Return the relationships of item_id to the other entries in graph.
+
+        An entry is related to every other entry sharing its category
+        (SAME_CATEGORY) or service (SAME_SERVICE), in graph order. Built
+        from the category/service indexes, so only entries sharing one of
+        the two keys are visited.
+        """
+        pos_by_id, by_category, by_service = self._graph_index(graph)
+        pos = pos_by_id.get(item_id)
+        if pos is None:
+            return []
+        entries = graph.entries
+        entry = entries[pos]
+        candidates = set(by_category.get(entry.category, ()))
+        candidates.update(by_service.get(entry.service_name, ()))
+        rels: list[MemoryRelationship] = []
+        for other_pos in sorted(candidates):
+            other = entries[other_pos]
+            if other.item_id == item_id:
                 continue
-            rels: list[MemoryRelationship] = []
-            if existing.category == item.category:
+            if other.category == entry.category:
                 rels.append(
                     MemoryRelationship(
-                        target_id=existing.item_id, relation_type="same_category"
+                        target_id=other.item_id, relation_type=RelationType.SAME_CATEGORY
                     )
                 )
-            if existing.service_name == item.service_name:
+            if other.service_name == entry.service_name:
                 rels.append(
                     MemoryRelationship(
-                        target_id=existing.item_id, relation_type="same_service"
+                        target_id=other.item_id, relation_type=RelationType.SAME_SERVICE
                     )
                 )
-            entry.relationships.extend(rels)
+        return rels
+
+    def upsert_many(
+        self,
+        items: Iterable[MemoryItem],
+        graph: MemoryGraph,
+        batch_size: int = _UPSERT_BATCH_SIZE,
+    ) -> int:
+        """Save and upsert a stream of memory items into graph.
+
+        Items are consumed batch_size at a time, so a generator of items is
+        never fully materialized. Each batch's markdown is written by
+        save_items() on a background thread while its graph entries are
+        built and indexed here; the writes are joined before the next batch.
+        Returns the number of items processed.
+        """
+        it = iter(items)
+        count = 0
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            while batch := list(islice(it, batch_size)):
+                written = writer.submit(self.save_items, batch)
+                for item in batch:
+                    graph = self._index_entry(_graph_entry(item), graph)
+                written.result()
+                count += len(batch)
+        return count
+
+    def upsert(
+        self, item: MemoryItem, graph: MemoryGraph, save_markdown: bool = True
+    ) -> MemoryGraph:
+        """Add or update a memory item in the graph and save the markdown.
+
+        Pass save_markdown=False when the markdown was already written, e.g.
+        by save_items() for a whole batch.
+        """
+        if save_markdown:
+            self.save_item(item)
+        return self._index_entry(_graph_entry(item), graph)
+
+    def _index_entry(self, entry: MemoryGraphEntry, graph: MemoryGraph) -> MemoryGraph:
+        """Insert entry into graph, replacing any entry with the same item_id."""
+        pos_by_id, by_category, by_service = self._graph_index(graph)
+        entries = graph.entries
 
         # Upsert in graph
-        found = False
-        for i, e in enumerate(graph.entries):
-            if e.item_id == entry.item_id:
-                graph.entries[i] = entry
-                found = True
-                break
-        if not found:
-            graph.entries.append(entry)
+        pos = pos_by_id.get(entry.item_id)
+        if pos is None:
+            pos = len(entries)
+            entries.append(entry)
+            pos_by_id[entry.item_id] = pos
+            by_category[entry.category].append(pos)
+            by_service[entry.service_name].append(pos)
+        else:
+            old = entries[pos]
+            entries[pos] = entry
+            if old.category != entry.category:
+                by_category[old.category].remove(pos)
+                by_category[entry.category].append(pos)
+            if old.service_name != entry.service_name:
+                by_service[old.service_name].remove(pos)
+                by_service[entry.service_name].append(pos)
 
         return graph
 
 
+def _graph_entry(item: MemoryItem) -> MemoryGraphEntry:
+    """Build the metadata-only graph entry for a memory item."""
+    return MemoryGraphEntry(
+        item_id=item.item_id,
+        finding_id=item.finding_id,
+        category=item.category,
+        service_name=item.service_name,
+        severity=item.severity,
+        data_source=item.data_source,
+        outcome=item.outcome,
+        confidence=item.confidence,
+        fix_approach_summary=item.fix_approach[:100] if item.fix_approach else None,
+        created_at=item.created_at,
+        run_id=item.run_id,
+    )
+
+
+def _construct_graph(data: dict[str, Any]) -> MemoryGraph:
+    """Build a MemoryGraph from graph.json data without field validation.
+
+    graph.json is only written by save_graph from validated models, so the
+    on-disk shape is trusted; entries missing required fields are still
+    rejected with a KeyError. Keys no longer in the model, such as the
+    relationships older graphs stored, are dropped by model_construct.
+    """
+    entries = []
+    for d in data["entries"]:
+        missing = [name for name in _REQUIRED_ENTRY_FIELDS if name not in d]
+        if missing:
+            raise KeyError(f"graph entry missing {', '.join(missing)}")
+        entries.append(MemoryGraphEntry.model_construct(**d))
+    return MemoryGraph.model_construct(version=data.get("version", 1), entries=entries)
+
+
+def _copy_graph(graph: MemoryGraph) -> MemoryGraph:
+    """Copy a graph with its own entries list, sharing the entry objects."""
+    return graph.model_copy(update={"entries": list(graph.entries)})
+
+
 def _render_markdown(item: MemoryItem) -> str:
     """Render a MemoryItem as a markdown document."""
     outcome_emoji = "SUCCESS" if item.outcome == "success" else "FAILED"
@@ -71,6 +71,13 @@ class RemediationSession(BaseModel):
     error_message: str | None = None
     data_source: str = "mock"  # "live" | "mock"
     version: int = 0
+    # Adaptive polling: when the current structured-output stage was first
+    # seen, and the earliest time the poller should check this session again
+    stage_entered_at: datetime | None = None
+    next_poll_at: datetime | None = None
+    # Set once a webhook push has been received; polling then drops to a
+    # slow safety net (config.webhook_fallback_poll_seconds)
+    webhook_confirmed: bool = False
     # HITL review fields
     review_status: str | None = None  # "pending" | "approved" | "rejected" | None
     reviewed_by: str | None = None
@@ -101,4 +108,8 @@ class BatchRun(BaseModel):
     prs_created: int = 0
     status: str = "pending"  # pending, running, completed, paused
     data_source: str = "mock"  # "live" | "mock" | "hybrid"
-    events: list[dict[str, Any]] = Field(default_factory=list)  # Timeline events for the dashboard
+    # Most recent timeline events for the dashboard; the tracker appends the
+    # full history to runs/<run_id>/events.jsonl
+    events: list[dict[str, Any]] = Field(default_factory=list)
+    # Observed stage dwell times: stage -> [transitions seen, total seconds]
+    stage_dwell: dict[str, list[float]] = Field(default_factory=dict)
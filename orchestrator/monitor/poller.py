@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from orchestrator.config import OrchestratorConfig
@@ -21,46 +22,101 @@ _TERMINAL_STATUSES = {
 # BLOCKED is NOT terminal — Devin may still be working or waiting for input.
 # If blocked + PR, interpret_session_status already maps to SUCCESS.
 
+# Adaptive polling: sessions younger than this are polled every
+# _EARLY_POLL_SECONDS, since early stage changes come quickly
+_EARLY_SESSION_SECONDS = 30
+_EARLY_POLL_SECONDS = 2.0
+# Stage dwell means need this many observed transitions before they are used
+_MIN_STAGE_SAMPLES = 3
+# Upper bound on the adaptive delay, as a multiple of poll_interval_seconds
+_MAX_POLL_STRETCH = 1.5
+# Sessions due within this window are polled now rather than next cycle
+_POLL_SLACK = timedelta(milliseconds=50)
+
+# Human-readable stage labels for progress events
+_STAGE_LABELS = {
+    "analyzing": "Analyzing vulnerability",
+    "fixing": "Applying fix",
+    "testing": "Running tests",
+    "creating_pr": "Creating pull request",
+    "completed": "Completed",
+    "failed": "Failed",
+}
+
 
 async def poll_session(
     client: Any,  # DevinClient or MockDevinClient
     session: RemediationSession,
+    poll_sem: asyncio.Semaphore | None = None,
 ) -> RemediationSession:
     """Poll a single session and update its state.
 
+    If poll_sem is given, the API call is made while holding it.
     On API failure, logs the error and returns the session unchanged.
     """
-    try:
-        response = await client.get_session(session.session_id)
-
-        # Update structured output
-        structured_output = response.get("structured_output")
-        if structured_output is not None:
-            session.structured_output = structured_output
-
-        # Interpret the status
-        new_status, pr_url, error_message = interpret_session_status(response)
-
-        if new_status in _TERMINAL_STATUSES:
-            session.status = new_status
-            session.completed_at = datetime.now(timezone.utc)
-            if pr_url:
-                session.pr_url = pr_url
-            if error_message:
-                session.error_message = error_message
-        elif new_status == SessionStatus.WORKING:
-            session.status = SessionStatus.WORKING
-            if pr_url:
-                session.pr_url = pr_url
+    response = await _fetch_session(client, session, poll_sem)
+    if response is not None:
+        _safe_apply(session, response)
+    return session
+
+
+def apply_session_response(session: RemediationSession, response: dict[str, Any]) -> None:
+    """Update a session from a Devin session payload.
+
+    The payload has the shape of GET /sessions/{id} (status_enum,
+    structured_output, pull_request); webhook pushes use the same shape.
+    """
+    # Update structured output
+    structured_output = response.get("structured_output")
+    if structured_output is not None:
+        session.structured_output = structured_output
+
+    # Interpret the status
+    new_status, pr_url, error_message = interpret_session_status(response)
+
+    if new_status in _TERMINAL_STATUSES:
+        session.status = new_status
+        session.completed_at = datetime.now(timezone.utc)
+        if pr_url:
+            session.pr_url = pr_url
+        if error_message:
+            session.error_message = error_message
+    elif new_status == SessionStatus.WORKING:
+        session.status = SessionStatus.WORKING
+        if pr_url:
+            session.pr_url = pr_url
 
+
+async def _fetch_session(
+    client: Any,
+    session: RemediationSession,
+    poll_sem: asyncio.Semaphore | None,
+) -> dict[str, Any] | None:
+    """GET a session's details, or None (logged) if the API call fails."""
+    try:
+        if poll_sem is None:
+            return await client.get_session(session.session_id)
+        async with poll_sem:
+            return await client.get_session(session.session_id)
     except Exception as exc:
         logger.error(
             "Failed to poll session %s: %s",
             session.session_id,
             exc,
         )
+        return None
 
-    return session
+
+def _safe_apply(session: RemediationSession, response: dict[str, Any]) -> None:
+    """apply_session_response, logging instead of raising on a bad payload."""
+    try:
+        apply_session_response(session, response)
+    except Exception as exc:
+        logger.error(
+            "Failed to poll session %s: %s",
+            session.session_id,
+            exc,
+        )
 
 
 async def poll_active_sessions(
@@ -72,102 +128,57 @@ async def poll_active_sessions(
     """Poll all active sessions once and return still-active ones.
 
     Also checks for timeouts based on config.session_timeout_minutes.
+    The HTTP polls run concurrently, at most config.max_poll_concurrency
+    at a time; tracker updates and events are then applied one session at
+    a time, in input order.
     """
     now = datetime.now(timezone.utc)
-    timeout_seconds = config.session_timeout_minutes * 60
+    # Sessions created before this have exceeded session_timeout_minutes
+    timeout_cutoff = now - timedelta(minutes=config.session_timeout_minutes)
     still_active: list[RemediationSession] = []
 
     active_sessions = [s for s in sessions if s.status in _ACTIVE_STATUSES]
 
+    # Find sessions that have timed out, and skip those whose adaptive
+    # next poll is not due yet
+    pending: list[tuple[RemediationSession, str]] = []
+    to_poll: list[RemediationSession] = []
+    due_by = now + _POLL_SLACK
     for session in active_sessions:
-        old_status = session.status
-
-        # Capture previous structured output stage for progress tracking
-        old_so = session.structured_output
-        old_stage = old_so.get("status") if old_so and isinstance(old_so, dict) else None
-
-        # Check for timeout before polling
-        if session.created_at is not None:
-            elapsed = (now - session.created_at).total_seconds()
-            if elapsed > timeout_seconds:
-                session.status = SessionStatus.TIMEOUT
-                session.error_message = "Session timed out"
-                session.completed_at = now
-                tracker.update_session(session)
-                tracker.add_event(
-                    "session_failed",
-                    f"Session {session.finding.finding_id} timed out",
-                    {
-                        "finding_id": session.finding.finding_id,
-                        "session_id": session.session_id,
-                        "reason": "timeout",
-                    },
-                )
-                continue
-
-        # Poll the session
-        session = await poll_session(client, session)
-
-        # Emit progress event when structured output stage changes
-        new_so = session.structured_output
-        new_stage = new_so.get("status") if new_so and isinstance(new_so, dict) else None
-        if new_stage and new_stage != old_stage:
-            step_msg = (
-                new_so.get("current_step", "")
-                if new_so and isinstance(new_so, dict)
-                else ""
-            )
-            progress_pct = (
-                new_so.get("progress_pct", 0)
-                if new_so and isinstance(new_so, dict)
-                else 0
-            )
-            # Human-readable stage label
-            stage_labels = {
-                "analyzing": "Analyzing vulnerability",
-                "fixing": "Applying fix",
-                "testing": "Running tests",
-                "creating_pr": "Creating pull request",
-                "completed": "Completed",
-                "failed": "Failed",
-            }
-            label = stage_labels.get(new_stage, new_stage)
-            tracker.add_event(
-                "session_progress",
-                f"{session.finding.finding_id}: {label}",
-                {
-                    "finding_id": session.finding.finding_id,
-                    "session_id": session.session_id,
-                    "stage": new_stage,
-                    "progress_pct": progress_pct,
-                    "current_step": step_msg,
-                },
-            )
+        if session.created_at is not None and session.created_at < timeout_cutoff:
+            action = "timeout"
+        elif session.next_poll_at is not None and session.next_poll_at > due_by:
+            action = "skip"
+        else:
+            action = "poll"
+            to_poll.append(session)
+        pending.append((session, action))
 
-        # Check if status changed
-        if session.status != old_status:
-            tracker.update_session(session)
-
-            if session.status == SessionStatus.SUCCESS:
-                tracker.add_event(
-                    "session_completed",
-                    f"Session {session.finding.finding_id} completed successfully",
-                    {
-                        "finding_id": session.finding.finding_id,
-                        "session_id": session.session_id,
-                        "pr_url": session.pr_url,
-                    },
-                )
-            elif session.status in _TERMINAL_STATUSES:
-                tracker.add_event(
-                    "session_failed",
-                    f"Session {session.finding.finding_id} failed with status {session.status.value}",
-                    {
-                        "finding_id": session.finding.finding_id,
-                        "session_id": session.session_id,
-                        "error": session.error_message,
-                    },
-                )
+    # Fetch concurrently; _fetch_session logs and swallows API errors, so one
+    # failed poll cannot cancel the others, and the semaphore keeps a large
+    # wave from tripping the API's rate limit
+    poll_sem = asyncio.Semaphore(max(1, config.max_poll_concurrency))
+    responses = await asyncio.gather(
+        *(_fetch_session(client, s, poll_sem) for s in to_poll)
+    )
+    response_for = {id(s): r for s, r in zip(to_poll, responses)}
+    polled_at = datetime.now(timezone.utc)
+
+    # Apply results with no awaits in between, so a webhook push handled
+    # on the same loop cannot interleave with a half-applied update
+    for session, action in pending:
+        if action == "timeout":
+            _apply_timeout(session, tracker, now)
+            continue
+        if action == "poll":
+            response = response_for[id(session)]
+            # A webhook may have finished the session while the GET was in
+            # flight; don't let the older poll response overwrite it
+            if response is not None and session.status in _ACTIVE_STATUSES:
+                _apply_response(session, response, tracker, polled_at)
+            session.next_poll_at = polled_at + timedelta(
+                seconds=_next_poll_delay(session, tracker, config, polled_at)
+            )
 
         # Collect still-active sessions
         if session.status in _ACTIVE_STATUSES:
@@ -175,3 +186,184 @@ async def poll_active_sessions(
 
     tracker.save_state()
     return still_active
+
+
+def apply_pushed_update(
+    session: RemediationSession,
+    payload: dict[str, Any],
+    tracker: Any,  # ProgressTracker
+    config: OrchestratorConfig,
+) -> bool:
+    """Apply a webhook-pushed session payload the same way a poll result is.
+
+    The session is marked webhook_confirmed, which drops its polling to the
+    webhook_fallback_poll_seconds safety net. Returns False (and changes
+    nothing) if the session is no longer active.
+    """
+    if session.status not in _ACTIVE_STATUSES:
+        return False
+    now = datetime.now(timezone.utc)
+    _apply_response(session, payload, tracker, now)
+    session.webhook_confirmed = True
+    session.next_poll_at = now + timedelta(
+        seconds=_next_poll_delay(session, tracker, config, now)
+    )
+    return True
+
+
+def seconds_until_next_poll(
+    sessions: list[RemediationSession], config: OrchestratorConfig
+) -> float:
+    """Return how long to sleep before any active session is due for a poll.
+
+    Never longer than config.poll_interval_seconds.
+    """
+    base = float(config.poll_interval_seconds)
+    due = [s.next_poll_at for s in sessions if s.status in _ACTIVE_STATUSES]
+    if not due or any(t is None for t in due):
+        return 0.0 if due else base
+    wait = (min(due) - datetime.now(timezone.utc)).total_seconds()
+    return min(base, max(0.0, wait))
+
+
+def _next_poll_delay(
+    session: RemediationSession,
+    tracker: Any,
+    config: OrchestratorConfig,
+    now: datetime,
+) -> float:
+    """Seconds until a session should next be polled.
+
+    Sessions receiving webhook pushes are only polled as a safety net,
+    every webhook_fallback_poll_seconds. Young sessions are polled every
+    _EARLY_POLL_SECONDS. Otherwise, once
+    enough transitions out of the current stage have been seen, the delay
+    is half the expected time left in the stage, so polls get denser as
+    the typical transition time approaches. Sessions past the typical
+    dwell time, or in stages without history, use poll_interval_seconds.
+    """
+    base = float(config.poll_interval_seconds)
+    if session.webhook_confirmed:
+        return max(base, float(config.webhook_fallback_poll_seconds))
+    floor = min(base, _EARLY_POLL_SECONDS)
+    if (
+        session.created_at is not None
+        and (now - session.created_at).total_seconds() < _EARLY_SESSION_SECONDS
+    ):
+        return floor
+
+    stage = _stage_of(session.structured_output)
+    if not stage or session.stage_entered_at is None:
+        return base
+    mean_dwell = tracker.mean_stage_dwell(stage, min_samples=_MIN_STAGE_SAMPLES)
+    if mean_dwell is None:
+        return base
+    remaining = mean_dwell - (now - session.stage_entered_at).total_seconds()
+    if remaining <= 0:
+        return base
+    return min(max(remaining / 2, floor), base * _MAX_POLL_STRETCH)
+
+
+def _unpack_so(so: Any) -> tuple[str | None, str, Any]:
+    """Return (stage, current_step, progress_pct) from a structured output.
+
+    Payloads that are missing or not a dict unpack to (None, "", 0).
+    """
+    if not so or not isinstance(so, dict):
+        return None, "", 0
+    return so.get("status"), so.get("current_step", ""), so.get("progress_pct", 0)
+
+
+def _stage_of(so: Any) -> str | None:
+    """Return the stage ("status") of a structured output, if any."""
+    return so.get("status") if so and isinstance(so, dict) else None
+
+
+def _apply_timeout(session: RemediationSession, tracker: Any, now: datetime) -> None:
+    """Mark a session as timed out and record it on the tracker."""
+    session.status = SessionStatus.TIMEOUT
+    session.error_message = "Session timed out"
+    session.completed_at = now
+    tracker.update_session(session)
+    tracker.add_event(
+        "session_failed",
+        f"Session {session.finding.finding_id} timed out",
+        {
+            "finding_id": session.finding.finding_id,
+            "session_id": session.session_id,
+            "reason": "timeout",
+        },
+    )
+
+
+def _apply_response(
+    session: RemediationSession,
+    response: dict[str, Any],
+    tracker: Any,
+    now: datetime,
+) -> None:
+    """Apply a session payload, then emit events and update the tracker."""
+    old_status = session.status
+    old_pr_url = session.pr_url
+    old_stage = _stage_of(session.structured_output)
+    _safe_apply(session, response)
+    _apply_poll_result(session, old_status, old_stage, old_pr_url, tracker, now)
+
+
+def _apply_poll_result(
+    session: RemediationSession,
+    old_status: SessionStatus,
+    old_stage: str | None,
+    old_pr_url: str | None,
+    tracker: Any,
+    now: datetime,
+) -> None:
+    """Emit progress/status events and update the tracker for a polled session."""
+    # Emit progress event when structured output stage changes
+    new_stage, step_msg, progress_pct = _unpack_so(session.structured_output)
+    if new_stage and new_stage != old_stage:
+        # Record how long the previous stage lasted for adaptive polling
+        if old_stage and session.stage_entered_at is not None:
+            tracker.record_stage_dwell(
+                old_stage, (now - session.stage_entered_at).total_seconds()
+            )
+        session.stage_entered_at = now
+        label = _STAGE_LABELS.get(new_stage, new_stage)
+        tracker.add_event(
+            "session_progress",
+            f"{session.finding.finding_id}: {label}",
+            {
+                "finding_id": session.finding.finding_id,
+                "session_id": session.session_id,
+                "stage": new_stage,
+                "progress_pct": progress_pct,
+                "current_step": step_msg,
+            },
+        )
+
+    # Counters depend on status and on whether a PR exists
+    if session.status != old_status or session.pr_url != old_pr_url:
+        tracker.update_session(session)
+
+    # Emit completion/failure events if status changed
+    if session.status != old_status:
+        if session.status == SessionStatus.SUCCESS:
+            tracker.add_event(
+                "session_completed",
+                f"Session {session.finding.finding_id} completed successfully",
+                {
+                    "finding_id": session.finding.finding_id,
+                    "session_id": session.session_id,
+                    "pr_url": session.pr_url,
+                },
+            )
+        elif session.status in _TERMINAL_STATUSES:
+            tracker.add_event(
+                "session_failed",
+                f"Session {session.finding.finding_id} failed with status {session.status.value}",
+                {
+                    "finding_id": session.finding.finding_id,
+                    "session_id": session.session_id,
+                    "error": session.error_message,
+                },
+            )
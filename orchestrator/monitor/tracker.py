@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-from orchestrator.models import BatchRun, RemediationSession, SessionStatus
-from orchestrator.utils import atomic_write_json, with_file_lock
+from orchestrator.models import BatchRun, RemediationSession, SessionStatus, Wave
+from orchestrator.utils import (
+    atomic_write_bytes,
+    atomic_write_json,
+    json_dumps_bytes,
+    json_loads,
+    with_file_lock,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +37,26 @@ _ACTIVE_STATUSES = {
     SessionStatus.WORKING,
 }
 
+# Timeline events kept on the BatchRun (and so in state.json); the full
+# history is appended to runs/<run_id>/events.jsonl
+_MAX_RECENT_EVENTS = 500
+
+# Sessions in these states are no longer polled or updated (unless retried)
+_SETTLED_STATUSES = {
+    SessionStatus.SUCCESS,
+    SessionStatus.FAILED,
+    SessionStatus.TIMEOUT,
+}
+
 
 class ProgressTracker:
     """Tracks aggregate progress of a BatchRun and persists state to disk.
 
     The state file (state.json) contains the full BatchRun serialized via
-    model_dump(mode='json'). The Next.js dashboard reads this file via
-    an API route every 5 seconds.
+    model_dump(mode='json'), with only the most recent timeline events;
+    every event is also appended to events.jsonl in the run directory.
+    The Next.js dashboard reads the state file via an API route every
+    5 seconds.
     """
 
     def __init__(
@@ -49,17 +70,105 @@ class ProgressTracker:
         self._runs_dir = Path(runs_dir)
         self._run_dir = self._runs_dir / batch_run.run_id
         self._run_dir.mkdir(parents=True, exist_ok=True)
+        # Per-session (session, wave, status, has PR) as last counted by
+        # update_session, keyed by id(session); filled by the first recount
+        self._counted: dict[int, tuple[RemediationSession, Wave, SessionStatus, bool]] = {}
+        self._counted_waves: list[Wave] | None = None
+        # Summary counters kept alongside: active sessions, and per wave
+        # number the sessions that have left PENDING
+        self._active_sessions = 0
+        self._started_by_wave: dict[int, int] = {}
+        # id(wave) -> (wave, cache key, JSON dump) for settled waves
+        self._wave_dumps: dict[int, tuple[Wave, tuple[Any, ...], dict[str, Any]]] = {}
+        self._events_path = self._run_dir / "events.jsonl"
+        self._events_fh: IO[bytes] | None = None
+        # Bumped and set by update_session so poll loops can wake early on
+        # a change, including one made while they were still polling
+        self._change_count = 0
+        self._changed = asyncio.Event()
+        # session_id -> session, rebuilt lazily when a lookup misses
+        self._by_session_id: dict[str, RemediationSession] = {}
+        # This run's runs/index.json entry as last written
+        self._last_index_summary: dict[str, Any] | None = None
 
     @property
     def batch_run(self) -> BatchRun:
         return self._batch_run
 
+    def find_session(self, session_id: str) -> RemediationSession | None:
+        """Return the session with this Devin session_id, or None.
+
+        Served from an index that is rebuilt when a lookup misses or finds
+        a stale entry (session ids are assigned at dispatch and change on
+        retry).
+        """
+        session = self._by_session_id.get(session_id)
+        if session is not None and session.session_id == session_id:
+            return session
+        self._by_session_id = {
+            s.session_id: s
+            for wave in self._batch_run.waves
+            for s in wave.sessions
+            if s.session_id is not None
+        }
+        return self._by_session_id.get(session_id)
+
     def update_session(self, session: RemediationSession) -> None:
+        """Update aggregate counters after a session's status or PR changed.
+
+        The (status, has PR) each session was last counted with is
+        remembered, so only the difference is applied instead of walking
+        every session. Sessions not counted before, or a replaced waves
+        list, fall back to a full recount.
+        """
+        self._change_count += 1
+        self._changed.set()
+        entry = self._counted.get(id(session))
+        if (
+            entry is None
+            or entry[0] is not session
+            or self._counted_waves is not self._batch_run.waves
+        ):
+            self._recount()
+            return
+
+        _, wave, old_status, old_has_pr = entry
+        has_pr = session.pr_url is not None
+        self._apply_counts(wave, old_status, old_has_pr, -1)
+        self._apply_counts(wave, session.status, has_pr, 1)
+        self._counted[id(session)] = (session, wave, session.status, has_pr)
+
+    @property
+    def change_count(self) -> int:
+        """Number of update_session calls so far; pass to wait_for_change."""
+        return self._change_count
+
+    async def wait_for_change(self, timeout: float, seen: int) -> bool:
+        """Wait up to timeout seconds for a session change after `seen`.
+
+        `seen` is the change_count read before the caller's poll pass, so
+        a webhook push handled during that pass wakes it immediately.
+        Returns True if a session changed, False on timeout. Lets a poll
+        loop react to webhook pushes instead of sleeping out its interval.
+        """
+        if self._change_count != seen:
+            return True
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def _recount(self) -> None:
         """Recount all aggregate counters by iterating all sessions across all waves."""
         completed = 0
         successful = 0
         failed = 0
         prs_created = 0
+        active_sessions = 0
+        started_by_wave: dict[int, int] = {}
+        counted: dict[int, tuple[RemediationSession, Wave, SessionStatus, bool]] = {}
 
         for wave in self._batch_run.waves:
             wave_success = 0
@@ -76,6 +185,11 @@ class ProgressTracker:
                     wave_failure += 1
                 if sess.pr_url is not None:
                     prs_created += 1
+                if sess.status in _ACTIVE_STATUSES:
+                    active_sessions += 1
+                if sess.status != SessionStatus.PENDING:
+                    started_by_wave[wave.wave_number] = started_by_wave.get(wave.wave_number, 0) + 1
+                counted[id(sess)] = (sess, wave, sess.status, sess.pr_url is not None)
 
             wave.success_count = wave_success
             wave.failure_count = wave_failure
@@ -84,6 +198,46 @@ class ProgressTracker:
         self._batch_run.successful = successful
         self._batch_run.failed = failed
         self._batch_run.prs_created = prs_created
+        self._active_sessions = active_sessions
+        self._started_by_wave = started_by_wave
+        self._counted = counted
+        self._counted_waves = self._batch_run.waves
+
+    def _apply_counts(self, wave: Wave, status: SessionStatus, has_pr: bool, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one session's contribution to the counters."""
+        run = self._batch_run
+        if status in _TERMINAL_STATUSES:
+            run.completed += sign
+        if status == SessionStatus.SUCCESS:
+            run.successful += sign
+            wave.success_count += sign
+        if status in _FAILURE_STATUSES:
+            run.failed += sign
+            wave.failure_count += sign
+        if has_pr:
+            run.prs_created += sign
+        if status in _ACTIVE_STATUSES:
+            self._active_sessions += sign
+        if status != SessionStatus.PENDING:
+            started = self._started_by_wave
+            started[wave.wave_number] = started.get(wave.wave_number, 0) + sign
+
+    def record_stage_dwell(self, stage: str, seconds: float) -> None:
+        """Record how long a session spent in a structured-output stage."""
+        stats = self._batch_run.stage_dwell.setdefault(stage, [0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+
+    def mean_stage_dwell(self, stage: str, min_samples: int = 1) -> float | None:
+        """Return the mean observed dwell time for a stage.
+
+        Returns None if fewer than min_samples transitions out of the stage
+        have been recorded.
+        """
+        stats = self._batch_run.stage_dwell.get(stage)
+        if not stats or stats[0] < max(1, min_samples):
+            return None
+        return stats[1] / stats[0]
 
     def add_event(
         self,
@@ -91,32 +245,45 @@ class ProgressTracker:
         message: str,
         details: dict[str, Any] | None = None,
     ) -> None:
-        """Add a timeline event to the batch run."""
+        """Add a timeline event to the batch run and append it to events.jsonl.
+
+        The BatchRun keeps only the last _MAX_RECENT_EVENTS events, so
+        state.json stays bounded on long runs.
+        """
         event: dict[str, Any] = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "event_type": event_type,
             "message": message,
             "details": details or {},
         }
-        self._batch_run.events.append(event)
+        events = self._batch_run.events
+        events.append(event)
+        if len(events) > _MAX_RECENT_EVENTS:
+            del events[: len(events) - _MAX_RECENT_EVENTS]
+
+        if self._events_fh is None:
+            self._events_fh = self._events_path.open("ab")
+        self._events_fh.write(json_dumps_bytes(event) + b"\n")
+        self._events_fh.flush()
+
+    def close(self) -> None:
+        """Close the events.jsonl handle; a later add_event reopens it."""
+        if self._events_fh is not None:
+            self._events_fh.close()
+            self._events_fh = None
 
     def get_summary(self) -> dict[str, Any]:
-        """Return aggregate stats for the dashboard overview cards."""
-        active_sessions = 0
-        pending_reviews = 0
-        current_wave = 0
+        """Return aggregate stats for the dashboard overview cards.
 
-        for wave in self._batch_run.waves:
-            has_non_pending = False
-            for sess in wave.sessions:
-                if sess.status in _ACTIVE_STATUSES:
-                    active_sessions += 1
-                if sess.pr_url is not None:
-                    pending_reviews += 1
-                if sess.status != SessionStatus.PENDING:
-                    has_non_pending = True
-            if has_non_pending and wave.wave_number > current_wave:
-                current_wave = wave.wave_number
+        Reads the counters maintained by update_session; they are built by
+        a full recount the first time, or if the waves list was replaced.
+        """
+        if self._counted_waves is not self._batch_run.waves:
+            self._recount()
+        current_wave = max(
+            (number for number, started in self._started_by_wave.items() if started > 0),
+            default=0,
+        )
 
         completed = self._batch_run.completed
         success_rate = (
@@ -130,8 +297,9 @@ class ProgressTracker:
             "failed": self._batch_run.failed,
             "prs_created": self._batch_run.prs_created,
             "success_rate": success_rate,
-            "active_sessions": active_sessions,
-            "pending_reviews": pending_reviews,
+            "active_sessions": self._active_sessions,
+            # Every session with a PR awaits review
+            "pending_reviews": self._batch_run.prs_created,
             "status": self._batch_run.status,
             "current_wave": current_wave,
         }
@@ -141,43 +309,110 @@ class ProgressTracker:
 
         Returns the number of memory items saved.
         """
-        from orchestrator.memory.extractor import extract_memories
+        from orchestrator.memory.extractor import iter_memories
         from orchestrator.memory.store import MemoryStore
 
-        items = extract_memories(self._batch_run)
-        if not items:
-            return 0
-
         store = MemoryStore()
         graph = store.load_graph()
-
-        for item in items:
-            graph = store.upsert(item, graph)
+        count = store.upsert_many(iter_memories(self._batch_run), graph)
+        if not count:
+            return 0
 
         store.save_graph(graph)
-        logger.info(
-            "Saved %d memory items from run %s", len(items), self._batch_run.run_id
-        )
-        return len(items)
+        logger.info("Saved %d memory items from run %s", count, self._batch_run.run_id)
+        return count
 
     def save_state(self) -> None:
         """Write state to runs/<run_id>/state.json, update index, and legacy path."""
-        data = self._batch_run.model_dump(mode="json")
+        data = json_dumps_bytes(self._dump_state(), indent=True)
 
         # Per-run state
         run_state_path = self._run_dir / "state.json"
-        atomic_write_json(run_state_path, data)
+        atomic_write_bytes(run_state_path, data)
 
         # Update runs/index.json (with lock for cross-process safety)
         self._update_index()
 
-        # Legacy backward compatibility
-        atomic_write_json(self._state_file_path, data)
+        # Legacy backward compatibility: a symlink to the per-run file, so
+        # the document is only written once; a copy where links fail
+        if not self._link_legacy_state(run_state_path):
+            atomic_write_bytes(self._state_file_path, data)
 
         logger.debug("Saved state to %s and %s", run_state_path, self._state_file_path)
 
+    def _dump_state(self) -> dict[str, Any]:
+        """Return the BatchRun as JSON-ready data, reusing settled wave dumps."""
+        data = self._batch_run.model_dump(mode="json", exclude={"waves"})
+        data["waves"] = [self._dump_wave(wave) for wave in self._batch_run.waves]
+        # Keep the model's field order so the file reads as before
+        return {name: data[name] for name in BatchRun.model_fields if name in data}
+
+    def _dump_wave(self, wave: Wave) -> dict[str, Any]:
+        """Dump a wave, reusing the previous dump if the wave is settled and unchanged.
+
+        Only waves whose sessions have all finished are cached; nothing
+        polls those, so the fields in the cache key are the only ones that
+        can still change (through a retry).
+        """
+        if not all(s.status in _SETTLED_STATUSES for s in wave.sessions):
+            return wave.model_dump(mode="json")
+        key = (
+            wave.status,
+            wave.success_count,
+            wave.failure_count,
+            tuple(
+                (s.status, s.attempt, s.session_id, s.pr_url, s.completed_at)
+                for s in wave.sessions
+            ),
+        )
+        cached = self._wave_dumps.get(id(wave))
+        if cached is not None and cached[0] is wave and cached[1] == key:
+            return cached[2]
+        dumped = wave.model_dump(mode="json")
+        self._wave_dumps[id(wave)] = (wave, key, dumped)
+        return dumped
+
+    def _link_legacy_state(self, run_state_path: Path) -> bool:
+        """Point the legacy state file at run_state_path with a relative symlink.
+
+        Returns False if symlinks are unavailable here.
+        """
+        legacy = self._state_file_path
+        try:
+            target = os.path.relpath(run_state_path.resolve(), legacy.parent.resolve())
+            if legacy.is_symlink() and os.readlink(legacy) == target:
+                return True
+            tmp_link = legacy.with_suffix(".link.tmp")
+            if tmp_link.is_symlink() or tmp_link.exists():
+                tmp_link.unlink()
+            os.symlink(target, tmp_link)
+            os.replace(tmp_link, legacy)
+            return True
+        except (OSError, NotImplementedError) as exc:
+            logger.debug("Could not link %s, writing a copy: %s", legacy, exc)
+            return False
+
     def _update_index(self) -> None:
-        """Update or insert this run's entry in runs/index.json."""
+        """Update or insert this run's entry in runs/index.json.
+
+        Skipped when the entry is unchanged since this tracker last wrote
+        it; the summary only changes on status transitions.
+        """
+        summary = {
+            "run_id": self._batch_run.run_id,
+            "started_at": (
+                self._batch_run.started_at.isoformat()
+                if hasattr(self._batch_run.started_at, "isoformat")
+                else str(self._batch_run.started_at)
+            ),
+            "status": self._batch_run.status,
+            "total_findings": self._batch_run.total_findings,
+            "csv_filename": None,
+            "data_source": self._batch_run.data_source,
+        }
+        if summary == self._last_index_summary:
+            return
+
         index_path = self._runs_dir / "index.json"
 
         with with_file_lock(index_path):
@@ -185,24 +420,10 @@ class ProgressTracker:
             entries: list[dict[str, Any]] = []
             if index_path.exists():
                 try:
-                    entries = json.loads(index_path.read_text(encoding="utf-8"))
+                    entries = json_loads(index_path.read_bytes())
                 except (json.JSONDecodeError, OSError):
                     entries = []
 
-            # Build summary for this run
-            summary = {
-                "run_id": self._batch_run.run_id,
-                "started_at": (
-                    self._batch_run.started_at.isoformat()
-                    if hasattr(self._batch_run.started_at, "isoformat")
-                    else str(self._batch_run.started_at)
-                ),
-                "status": self._batch_run.status,
-                "total_findings": self._batch_run.total_findings,
-                "csv_filename": None,
-                "data_source": self._batch_run.data_source,
-            }
-
             # Upsert: replace existing entry or append
             found = False
             for i, entry in enumerate(entries):
@@ -214,3 +435,4 @@ class ProgressTracker:
                 entries.append(summary)
 
             atomic_write_json(index_path, entries)
+        self._last_index_summary = summary
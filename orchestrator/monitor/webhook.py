@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+from typing import Any
+
+from aiohttp import web
+
+from orchestrator.config import OrchestratorConfig
+from orchestrator.monitor.poller import apply_pushed_update
+from orchestrator.utils import json_loads
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = "/devin/webhook"
+SIGNATURE_HEADER = "X-Devin-Signature"
+
+_TRACKER_KEY: web.AppKey[Any] = web.AppKey("tracker", object)
+_CONFIG_KEY: web.AppKey[OrchestratorConfig] = web.AppKey("config", OrchestratorConfig)
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """Return the hex HMAC-SHA256 signature expected in SIGNATURE_HEADER."""
+    return hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def create_webhook_app(
+    tracker: Any,  # ProgressTracker (use Any to avoid circular import)
+    config: OrchestratorConfig,
+) -> web.Application:
+    """Build the aiohttp app that receives Devin session state pushes.
+
+    Each POST to WEBHOOK_PATH carries a session payload in the same shape as
+    GET /sessions/{id} plus its session_id, and is applied through the same
+    update path the poller uses. Requests must be signed with
+    config.webhook_secret.
+    """
+    if not config.webhook_secret:
+        raise ValueError("webhook_secret must be set to receive webhooks")
+    app = web.Application()
+    app[_TRACKER_KEY] = tracker
+    app[_CONFIG_KEY] = config
+    app.router.add_post(WEBHOOK_PATH, _handle_webhook)
+    return app
+
+
+async def start_webhook_server(tracker: Any, config: OrchestratorConfig) -> web.AppRunner:
+    """Start the webhook server on config.webhook_host:webhook_port.
+
+    Returns the runner; call its cleanup() to stop the server.
+    """
+    runner = web.AppRunner(create_webhook_app(tracker, config))
+    await runner.setup()
+    await web.TCPSite(runner, config.webhook_host, config.webhook_port).start()
+    logger.info(
+        "Webhook server listening on %s:%d%s",
+        config.webhook_host,
+        config.webhook_port,
+        WEBHOOK_PATH,
+    )
+    return runner
+
+
+async def _handle_webhook(request: web.Request) -> web.Response:
+    tracker = request.app[_TRACKER_KEY]
+    config = request.app[_CONFIG_KEY]
+
+    body = await request.read()
+    # Compare as bytes: compare_digest rejects non-ASCII str arguments
+    signature = request.headers.get(SIGNATURE_HEADER, "").encode("utf-8", "replace")
+    expected = sign_payload(config.webhook_secret, body).encode()
+    if not hmac.compare_digest(signature, expected):
+        return web.json_response({"error": "invalid signature"}, status=401)
+
+    try:
+        payload = json_loads(body)
+    except ValueError:
+        return web.json_response({"error": "invalid JSON"}, status=400)
+    session_id = payload.get("session_id") if isinstance(payload, dict) else None
+    if not isinstance(session_id, str) or not session_id:
+        return web.json_response({"error": "missing session_id"}, status=400)
+
+    session = tracker.find_session(session_id)
+    if session is None:
+        return web.json_response({"error": "unknown session"}, status=404)
+
+    # Late pushes for finished sessions are acknowledged but not applied
+    if apply_pushed_update(session, payload, tracker, config):
+        tracker.save_state()
+        logger.debug("Applied webhook push for session %s", session_id)
+
+    return web.json_response({"ok": True})
+
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from orchestrator.models import Finding, RemediationSession, SessionStatus, Wave
+from orchestrator.models import Finding, RemediationSession, Wave
 
 
 def create_waves(
@@ -16,23 +16,13 @@ def create_waves(
         wave_number = i // wave_size + 1
         chunk = findings[i : i + wave_size]
 
+        # New sessions start PENDING on attempt 1 and waves start "pending";
+        # leaving those to the model defaults skips validating them per item
         sessions = [
-            RemediationSession(
-                finding=f,
-                playbook_id="",
-                status=SessionStatus.PENDING,
-                wave_number=wave_number,
-                attempt=1,
-            )
+            RemediationSession(finding=f, playbook_id="", wave_number=wave_number)
             for f in chunk
         ]
 
-        waves.append(
-            Wave(
-                wave_number=wave_number,
-                sessions=sessions,
-                status="pending",
-            )
-        )
+        waves.append(Wave(wave_number=wave_number, sessions=sessions))
 
     return waves
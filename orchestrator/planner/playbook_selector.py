@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
@@ -49,10 +50,10 @@ async def ensure_playbooks_uploaded(client: Any) -> dict[str, str]:
     # Deduplicate playbook paths
     unique_paths = sorted(set(PLAYBOOK_MAP.values()))
     path_to_id: dict[str, str] = {}
+    missing: list[tuple[str, str]] = []
 
     for rel_path in unique_paths:
-        title = Path(rel_path).stem  # e.g. "sql_injection.devin" → use full stem
-        # Use a cleaner title: strip .devin from stem
+        # Use a clean title: strip .devin.md from the file name
         title = Path(rel_path).name.replace(".devin.md", "")
 
         # Check if already uploaded
@@ -61,14 +62,25 @@ async def ensure_playbooks_uploaded(client: Any) -> dict[str, str]:
             logger.info("Playbook already exists: %s → %s", rel_path, existing[title])
             continue
 
-        # Read file from disk
-        file_path = Path(rel_path)
-        if not file_path.exists():
+        if not Path(rel_path).exists():
             logger.warning("Playbook file not found on disk: %s", rel_path)
             continue
+        missing.append((rel_path, title))
 
-        body = file_path.read_text(encoding="utf-8")
-        result = await client.create_playbook(title=title, body=body)
+    if not missing:
+        return path_to_id
+
+    # Read the missing playbooks off the event loop, then upload them together
+    bodies = await asyncio.gather(
+        *(asyncio.to_thread(Path(rel_path).read_text, encoding="utf-8") for rel_path, _ in missing)
+    )
+    results = await asyncio.gather(
+        *(
+            client.create_playbook(title=title, body=body)
+            for (_, title), body in zip(missing, bodies)
+        )
+    )
+    for (rel_path, _), result in zip(missing, results):
         playbook_id = result["playbook_id"]
         path_to_id[rel_path] = playbook_id
         logger.info("Uploaded playbook: %s → %s", rel_path, playbook_id)
@@ -89,27 +101,43 @@ def assign_playbooks(
     if playbook_ids:
         fallback_id = next(iter(playbook_ids.values()))
 
+    # Resolve each category once; findings share a handful of categories
+    category_ids: dict[FindingCategory, str | None] = {}
+
     for wave in waves:
         for session in wave.sessions:
-            path = get_playbook_path(session.finding.category)
-            pb_id = playbook_ids.get(path)
-
-            if pb_id is None:
-                if fallback_id is not None:
-                    logger.warning(
-                        "No playbook_id for category %s (path %s), using fallback %s",
-                        session.finding.category,
-                        path,
-                        fallback_id,
-                    )
-                    pb_id = fallback_id
-                else:
-                    logger.warning(
-                        "No playbook_id available for category %s, leaving empty",
-                        session.finding.category,
-                    )
-                    continue
-
-            session.playbook_id = pb_id
+            category = session.finding.category
+            if category not in category_ids:
+                category_ids[category] = _resolve_playbook_id(
+                    category, playbook_ids, fallback_id
+                )
+            pb_id = category_ids[category]
+            if pb_id is not None:
+                session.playbook_id = pb_id
 
     return waves
+
+
+def _resolve_playbook_id(
+    category: FindingCategory,
+    playbook_ids: dict[str, str],
+    fallback_id: str | None,
+) -> str | None:
+    """Return the playbook_id for a category, the fallback, or None."""
+    path = get_playbook_path(category)
+    pb_id = playbook_ids.get(path)
+    if pb_id is not None:
+        return pb_id
+    if fallback_id is not None:
+        logger.warning(
+            "No playbook_id for category %s (path %s), using fallback %s",
+            category,
+            path,
+            fallback_id,
+        )
+        return fallback_id
+    logger.warning(
+        "No playbook_id available for category %s, leaving empty",
+        category,
+    )
+    return None
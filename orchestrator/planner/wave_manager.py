@@ -5,9 +5,13 @@ import logging
 from typing import Any
 
 from orchestrator.config import OrchestratorConfig
-from orchestrator.devin.session_manager import create_remediation_session
+from orchestrator.devin.session_manager import (
+    build_memory_contexts,
+    create_remediation_sessions,
+    determine_data_source,
+)
 from orchestrator.models import BatchRun, RemediationSession, SessionStatus, Wave
-from orchestrator.monitor.poller import poll_active_sessions
+from orchestrator.monitor.poller import poll_active_sessions, seconds_until_next_poll
 from orchestrator.monitor.tracker import ProgressTracker
 
 logger = logging.getLogger(__name__)
@@ -134,21 +138,65 @@ class WaveManager:
         return batch_run
 
     async def dispatch_wave(self, wave: Wave) -> None:
-        """Dispatch all sessions in a wave sequentially."""
-        for i, session in enumerate(wave.sessions):
-            # Determine per-session routing
-            if self._config.hybrid_mode and self._mock_client:
-                from orchestrator.devin.session_manager import determine_data_source
-                ds = determine_data_source(session.finding, self._config)
-                chosen_client = self._client if ds == "live" else self._mock_client
-            else:
-                ds = self._data_source
-                chosen_client = self._client
+        """Dispatch all sessions in a wave, creating them concurrently."""
+        await self._create_sessions(wave.sessions)
+
+    async def poll_wave(self, wave: Wave) -> None:
+        """Poll all active sessions until they complete or timeout."""
+        await self._poll_until_settled(wave.sessions)
+
+    async def _poll_until_settled(self, sessions: list[RemediationSession]) -> None:
+        """Poll sessions, each through its own client, until none is active."""
+        # data_source is fixed at dispatch, so split the sessions by client
+        # once rather than on every pass
+        if self._config.hybrid_mode and self._mock_client:
+            pools = [
+                (self._client, [s for s in sessions if s.data_source == "live"]),
+                (self._mock_client, [s for s in sessions if s.data_source == "mock"]),
+            ]
+        else:
+            pools = [(self._client, sessions)]
+
+        while True:
+            seen = self._tracker.change_count
+            active: list[RemediationSession] = []
+            for client, pool in pools:
+                pool_active = [s for s in pool if s.status in _ACTIVE_STATUSES]
+                if pool_active:
+                    await poll_active_sessions(
+                        client, pool_active, self._tracker, self._config
+                    )
+                    active.extend(pool_active)
+            if not active:
+                break
 
-            await create_remediation_session(
-                chosen_client, session, self._config, ds,
-                ledger=self._ledger, run_id=self._run_id,
+            # Wake early if a session changed since this pass began, e.g.
+            # a webhook push handled while the polls were in flight
+            await self._tracker.wait_for_change(
+                seconds_until_next_poll(active, self._config), seen
             )
+
+    def _route(self, session: RemediationSession) -> tuple[Any, str]:
+        """Pick the client and data source for a session."""
+        if self._config.hybrid_mode and self._mock_client:
+            ds = determine_data_source(session.finding, self._config)
+            return (self._client if ds == "live" else self._mock_client), ds
+        return self._client, self._data_source
+
+    async def _create_sessions(self, sessions: list[RemediationSession]) -> None:
+        """Create Devin sessions for the given sessions and record them."""
+        dispatches = []
+        for session in sessions:
+            client, ds = self._route(session)
+            dispatches.append((client, session, ds))
+
+        await create_remediation_sessions(
+            dispatches, self._config,
+            ledger=self._ledger, run_id=self._run_id,
+            memory_contexts=build_memory_contexts([s.finding for s in sessions]),
+        )
+
+        for _, session, ds in dispatches:
             self._tracker.add_event(
                 "session_started",
                 f"Session started for {session.finding.finding_id}",
@@ -159,62 +207,40 @@ class WaveManager:
                 },
             )
             self._tracker.update_session(session)
-
-            # Brief pause between creates to let Devin register the session
-            if i < len(wave.sessions) - 1:
-                await asyncio.sleep(1)
+        self._flush_ledger()
         self._tracker.save_state()
 
-    async def poll_wave(self, wave: Wave) -> None:
-        """Poll all active sessions until they complete or timeout."""
-        while True:
-            active = [s for s in wave.sessions if s.status in _ACTIVE_STATUSES]
-            if not active:
-                break
-
-            if self._config.hybrid_mode and self._mock_client:
-                # Split by data_source and poll with the right client
-                live_active = [s for s in active if s.data_source == "live"]
-                mock_active = [s for s in active if s.data_source == "mock"]
-                if live_active:
-                    await poll_active_sessions(
-                        self._client, live_active, self._tracker, self._config
-                    )
-                if mock_active:
-                    await poll_active_sessions(
-                        self._mock_client, mock_active, self._tracker, self._config
-                    )
-            else:
-                await poll_active_sessions(
-                    self._client, active, self._tracker, self._config
-                )
-
-            await asyncio.sleep(self._config.poll_interval_seconds)
+    def _flush_ledger(self) -> None:
+        """Persist any buffered idempotency ledger entries."""
+        if self._ledger is not None:
+            self._ledger.flush()
 
     async def _cleanup_sessions(self, wave: Wave) -> None:
         """Terminate completed Devin sessions to free concurrent session slots."""
-        for session in wave.sessions:
-            if session.session_id is None:
-                continue
-            if session.status not in _TERMINAL_STATUSES:
-                continue
-            try:
-                client = self._client
-                if self._config.hybrid_mode and self._mock_client and session.data_source == "mock":
-                    client = self._mock_client
-                await client.terminate_session(session.session_id)
-                logger.info(
-                    "Terminated session %s (%s) to free concurrent slot",
-                    session.session_id[:16],
-                    session.finding.finding_id,
-                )
-            except Exception as exc:
-                # Best-effort — don't block the run if termination fails
-                logger.warning(
-                    "Could not terminate session %s: %s",
-                    session.session_id[:16],
-                    exc,
-                )
+        await asyncio.gather(*(
+            self._terminate_finished(session)
+            for session in wave.sessions
+            if session.session_id is not None and session.status in _TERMINAL_STATUSES
+        ))
+
+    async def _terminate_finished(self, session: RemediationSession) -> None:
+        try:
+            client = self._client
+            if self._config.hybrid_mode and self._mock_client and session.data_source == "mock":
+                client = self._mock_client
+            await client.terminate_session(session.session_id)
+            logger.info(
+                "Terminated session %s (%s) to free concurrent slot",
+                session.session_id[:16],
+                session.finding.finding_id,
+            )
+        except Exception as exc:
+            # Best-effort — don't block the run if termination fails
+            logger.warning(
+                "Could not terminate session %s: %s",
+                session.session_id[:16],
+                exc,
+            )
 
     async def _drain_stale_sessions(self) -> None:
         """Terminate any existing Devin sessions from previous runs to free slots."""
@@ -232,19 +258,12 @@ class WaveManager:
                 "Found %d existing Devin session(s) — terminating to free slots",
                 len(sessions_list),
             )
-            for s in sessions_list:
-                sid = s.get("session_id", "")
-                if not sid:
-                    continue
-                try:
-                    # Use best-effort: 404 (already gone) won't trip circuit breaker
-                    if hasattr(self._client, "terminate_session_best_effort"):
-                        await self._client.terminate_session_best_effort(sid)
-                    else:
-                        await self._client.terminate_session(sid)
-                    logger.info("Terminated stale session %s", sid[:16])
-                except Exception:
-                    pass  # Best-effort
+            # The terminations are independent, so issue them together
+            await asyncio.gather(*(
+                self._terminate_stale(sid)
+                for sid in (s.get("session_id", "") for s in sessions_list)
+                if sid
+            ))
 
             # Brief wait for Devin to release the slots
             await asyncio.sleep(3)
@@ -257,6 +276,17 @@ class WaveManager:
                 self._client.reset_circuit_breaker()
                 logger.info("Circuit breaker reset after drain")
 
+    async def _terminate_stale(self, sid: str) -> None:
+        try:
+            # Use best-effort: 404 (already gone) won't trip circuit breaker
+            if hasattr(self._client, "terminate_session_best_effort"):
+                await self._client.terminate_session_best_effort(sid)
+            else:
+                await self._client.terminate_session(sid)
+            logger.info("Terminated stale session %s", sid[:16])
+        except Exception:
+            pass  # Best-effort
+
     def check_gate(self, wave: Wave) -> bool:
         """Return True if success rate meets threshold, False to pause."""
         total = wave.total_count
@@ -283,6 +313,9 @@ class WaveManager:
                 session.completed_at = None
                 session.pr_url = None
                 session.structured_output = None
+                session.stage_entered_at = None
+                session.next_poll_at = None
+                session.webhook_confirmed = False
                 session.attempt += 1
 
                 self._tracker.add_event(
@@ -298,55 +331,7 @@ class WaveManager:
         if not retryable:
             return
 
-        # Dispatch retryable sessions sequentially
-        for i, session in enumerate(retryable):
-            if self._config.hybrid_mode and self._mock_client:
-                from orchestrator.devin.session_manager import determine_data_source
-                ds = determine_data_source(session.finding, self._config)
-                chosen_client = self._client if ds == "live" else self._mock_client
-            else:
-                ds = self._data_source
-                chosen_client = self._client
-
-            await create_remediation_session(
-                chosen_client, session, self._config, ds,
-                ledger=self._ledger, run_id=self._run_id,
-            )
-            self._tracker.add_event(
-                "session_started",
-                f"Session started for {session.finding.finding_id}",
-                {
-                    "finding_id": session.finding.finding_id,
-                    "session_id": session.session_id,
-                    "data_source": ds,
-                },
-            )
-            self._tracker.update_session(session)
-
-            if i < len(retryable) - 1:
-                await asyncio.sleep(1)
-        self._tracker.save_state()
+        await self._create_sessions(retryable)
 
         # Poll only the retryable sessions until they complete
-        while True:
-            active = [s for s in retryable if s.status in _ACTIVE_STATUSES]
-            if not active:
-                break
-
-            if self._config.hybrid_mode and self._mock_client:
-                live_active = [s for s in active if s.data_source == "live"]
-                mock_active = [s for s in active if s.data_source == "mock"]
-                if live_active:
-                    await poll_active_sessions(
-                        self._client, live_active, self._tracker, self._config
-                    )
-                if mock_active:
-                    await poll_active_sessions(
-                        self._mock_client, mock_active, self._tracker, self._config
-                    )
-            else:
-                await poll_active_sessions(
-                    self._client, active, self._tracker, self._config
-                )
-
-            await asyncio.sleep(self._config.poll_interval_seconds)
+        await self._poll_until_settled(retryable)
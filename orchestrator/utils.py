@@ -8,6 +8,20 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Generator
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+
+# Recorded in lock metadata and compared in _is_stale_lock; looked up once
+# since gethostname() can be slow. The PID is not cached, so forked
+# workers still record their own.
+_HOSTNAME = socket.gethostname()
+
+# First retry delay while a lock is held; doubles up to poll_interval
+_LOCK_MIN_BACKOFF = 0.001
+
 
 class FileLockTimeout(Exception):
     """Raised when a file lock cannot be acquired within the timeout."""
@@ -29,23 +43,25 @@ def with_file_lock(
     Args:
         target_path: The file being protected (lock file will be <target>.lock).
         timeout_seconds: Max time to wait for lock acquisition.
-        poll_interval: Seconds between retry attempts.
+        poll_interval: Longest wait between retry attempts; retries back off
+            from 1ms up to this, so short-held locks are picked up quickly.
         stale_timeout: Force-remove lock if older than this AND owner is dead.
         writer: Identifier for the lock owner (for debugging).
     """
     lock_path = Path(str(target_path) + ".lock")
     deadline = time.monotonic() + timeout_seconds
     acquired = False
+    backoff = min(_LOCK_MIN_BACKOFF, poll_interval)
 
     try:
         while time.monotonic() < deadline:
             try:
                 # O_CREAT | O_EXCL = atomic create-if-not-exists
-                fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
                 # Write metadata for stale detection
                 metadata = json.dumps({
                     "pid": os.getpid(),
-                    "host": socket.gethostname(),
+                    "host": _HOSTNAME,
                     "started_at": time.time(),
                     "writer": writer,
                 })
@@ -57,11 +73,12 @@ def with_file_lock(
                 # Lock exists — check if stale
                 if _is_stale_lock(lock_path, stale_timeout):
                     try:
-                        os.unlink(str(lock_path))
+                        os.unlink(lock_path)
                         continue  # Retry immediately after removing stale lock
                     except OSError:
                         pass  # Another process beat us to it
-                time.sleep(poll_interval)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, poll_interval)
 
         if not acquired:
             raise FileLockTimeout(
@@ -72,7 +89,7 @@ def with_file_lock(
     finally:
         if acquired:
             try:
-                os.unlink(str(lock_path))
+                os.unlink(lock_path)
             except OSError:
                 pass  # Lock already removed (shouldn't happen, but be safe)
 
@@ -80,15 +97,14 @@ def with_file_lock(
 def _is_stale_lock(lock_path: Path, stale_timeout: float) -> bool:
     """Check if a lock file is stale (owner dead + age exceeded)."""
     try:
-        content = lock_path.read_text(encoding="utf-8")
-        meta = json.loads(content)
+        meta = json_loads(lock_path.read_bytes())
         age = time.time() - meta.get("started_at", 0)
         if age < stale_timeout:
             return False
         # Age exceeded — check if owner process is dead (same host only)
         owner_pid = meta.get("pid")
         owner_host = meta.get("host")
-        if owner_host == socket.gethostname() and owner_pid:
+        if owner_host == _HOSTNAME and owner_pid:
             try:
                 os.kill(owner_pid, 0)  # Signal 0 = check if process exists
                 return False  # Process still alive
@@ -111,11 +127,36 @@ def atomic_write_json(path: str | Path, data: Any) -> None:
     """Write JSON atomically via temp file + rename.
 
     This prevents partial reads if another process reads during write.
+    Encoded with json_dumps_bytes, so orjson is used when it is installed.
     """
+    atomic_write_bytes(path, json_dumps_bytes(data, indent=True))
+
+
+def atomic_write_bytes(path: str | Path, data: bytes) -> None:
+    """Write pre-encoded bytes atomically via temp file + rename."""
     path = Path(path)
     tmp_path = path.with_suffix(".tmp")
-    tmp_path.write_text(
-        json.dumps(data, indent=2, default=str),
-        encoding="utf-8",
-    )
-    os.rename(str(tmp_path), str(path))
+    tmp_path.write_bytes(data)
+    # os.replace overwrites an existing target on Windows too
+    os.replace(tmp_path, path)
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or str, using orjson when it is installed.
+
+    Raises json.JSONDecodeError (orjson's error subclasses it) on bad input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(data: Any, *, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON bytes, using orjson when it is installed.
+
+    Unknown types are stringified (default=str).
+    indent=True uses 2-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, default=str).encode("utf-8")
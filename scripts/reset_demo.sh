@@ -65,7 +65,7 @@ else
 fi
 
 # Legacy state.json
-if [ -f "$PROJECT_ROOT/state.json" ]; then
+if [ -f "$PROJECT_ROOT/state.json" ] || [ -L "$PROJECT_ROOT/state.json" ]; then
   rm -f "$PROJECT_ROOT/state.json"
   ok "Deleted state.json"
 else
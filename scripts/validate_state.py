@@ -5,6 +5,16 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to stdlib json
+    orjson = None
+
+_VALID_STATUSES = {
+    "pending", "dispatched", "working", "blocked",
+    "success", "failed", "timeout",
+}
+
 
 def validate(state_path: str) -> list[str]:
     """Validate state.json and return a list of error messages (empty = passed)."""
@@ -15,7 +25,9 @@ def validate(state_path: str) -> list[str]:
         return [f"File not found: {state_path}"]
 
     try:
-        data = json.loads(path.read_text())
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
     except json.JSONDecodeError as e:
         return [f"Invalid JSON: {e}"]
 
@@ -65,11 +77,7 @@ def validate(state_path: str) -> list[str]:
                 errors.append(f"Session {fid}: invalid data_source={session_ds}")
 
             # Status sanity
-            valid_statuses = {
-                "pending", "dispatched", "working", "blocked",
-                "success", "failed", "timeout",
-            }
-            if status not in valid_statuses:
+            if status not in _VALID_STATUSES:
                 errors.append(f"Session {fid}: invalid status={status}")
 
             # Orphan check: completed session should have completed_at
@@ -138,3 +138,169 @@ class TestIdempotencyLedger:
         ledger = IdempotencyLedger(path)
         ledger.record("key-1", "session-abc", "2026-01-01T00:00:00")
         assert path.exists()
+
+    def test_records_are_buffered_until_flush(self, tmp_path: Path) -> None:
+        from orchestrator.devin.idempotency import IdempotencyLedger
+
+        path = tmp_path / "idempotency.json"
+        ledger = IdempotencyLedger(path, flush_interval=60.0)
+        ledger.record("key-1", "session-aaa", "2026-01-01T00:00:00")
+        ledger.record("key-2", "session-bbb", "2026-01-01T00:01:00")
+        on_disk = json.loads(path.read_text(encoding="utf-8"))
+        assert "key-2" not in on_disk
+
+        ledger.flush()
+        on_disk = json.loads(path.read_text(encoding="utf-8"))
+        assert on_disk["key-2"]["session_id"] == "session-bbb"
+
+
+class TestDevinClientRequest:
+    """Tests for DevinClient._request retry handling against a local server."""
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_status_then_succeeds(self) -> None:
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        from orchestrator.devin.client import DevinClient
+
+        calls = {"n": 0}
+
+        async def handler(request: web.Request) -> web.Response:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                return web.Response(status=503, text="busy")
+            return web.json_response({"session_id": "s-1"})
+
+        app = web.Application()
+        app.router.add_get("/sessions/s-1", handler)
+        async with TestServer(app) as server:
+            client = DevinClient(
+                api_key="test",
+                base_url=str(server.make_url("")),
+                retry_jitter_max=0.0,
+            )
+            with patch("orchestrator.devin.client.asyncio.sleep", new=AsyncMock()) as sleep:
+                result = await client.get_session("s-1")
+            await client.close()
+
+        assert result == {"session_id": "s-1"}
+        assert calls["n"] == 2
+        sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_reuses_one_pooled_session(self) -> None:
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        from orchestrator.devin.client import DevinClient
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response({"session_id": request.match_info["id"]})
+
+        app = web.Application()
+        app.router.add_get("/sessions/{id}", handler)
+        async with TestServer(app) as server:
+            async with DevinClient(api_key="test", base_url=str(server.make_url(""))) as client:
+                await client.get_session("s-1")
+                pooled = client._session
+                await client.get_session("s-2")
+                assert client._session is pooled
+            assert pooled.closed
+            assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_session_calls_are_coalesced(self) -> None:
+        import asyncio
+
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        from orchestrator.devin.client import DevinClient
+
+        hits: list[str] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            sid = request.match_info["sid"]
+            hits.append(sid)
+            return web.json_response({"session_id": sid})
+
+        app = web.Application()
+        app.router.add_get("/sessions/{sid}", handler)
+        async with TestServer(app) as server:
+            client = DevinClient(api_key="test", base_url=str(server.make_url("")))
+            results = await asyncio.gather(
+                client.get_session("a"),
+                client.get_session("b"),
+                client.get_session("a"),
+            )
+            await client.close()
+
+        assert [r["session_id"] for r in results] == ["a", "b", "a"]
+        assert sorted(hits) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_close_releases_callers_of_an_in_flight_get(self) -> None:
+        import asyncio
+
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        from orchestrator.devin.client import DevinClient
+
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(request: web.Request) -> web.Response:
+            entered.set()
+            await release.wait()
+            return web.json_response({"session_id": "a"})
+
+        app = web.Application()
+        app.router.add_get("/sessions/{sid}", handler)
+        async with TestServer(app) as server:
+            client = DevinClient(api_key="test", base_url=str(server.make_url("")))
+            caller = asyncio.create_task(client.get_session("a"))
+            await asyncio.wait_for(entered.wait(), 1.0)
+
+            await client.close()
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(caller, 1.0)
+            release.set()
+
+    @pytest.mark.asyncio
+    async def test_create_session_splices_preencoded_schema(self) -> None:
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        from orchestrator.devin.client import DevinClient
+        from orchestrator.devin.session_manager import (
+            REMEDIATION_OUTPUT_SCHEMA,
+            REMEDIATION_OUTPUT_SCHEMA_JSON,
+        )
+
+        received: list[dict] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            received.append(await request.json())
+            return web.json_response({"session_id": "s-1", "is_new_session": True})
+
+        app = web.Application()
+        app.router.add_post("/sessions", handler)
+        async with TestServer(app) as server:
+            client = DevinClient(api_key="test", base_url=str(server.make_url("")))
+            result = await client.create_session(
+                prompt='fix "this"',
+                tags=["wave-1"],
+                structured_output_schema=REMEDIATION_OUTPUT_SCHEMA,
+                structured_output_schema_json=REMEDIATION_OUTPUT_SCHEMA_JSON,
+            )
+            await client.close()
+
+        assert result["session_id"] == "s-1"
+        assert received == [{
+            "prompt": 'fix "this"',
+            "tags": ["wave-1"],
+            "idempotent": True,
+            "structured_output_schema": REMEDIATION_OUTPUT_SCHEMA,
+        }]
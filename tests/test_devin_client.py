@@ -49,7 +49,7 @@ async def test_mock_session_completes():
 
     # Fast-forward by manipulating the creation time
     sid = result["session_id"]
-    client._sessions[sid]["created_at"] -= 120  # Jump 120 seconds into the future
+    client._sessions[sid]["created_at_monotonic"] -= 120  # Jump 120 seconds into the future
 
     details = await client.get_session(sid)
     assert details["status_enum"] == "finished"
@@ -60,6 +60,22 @@ async def test_mock_session_completes():
     await client.close()
 
 
+@pytest.mark.asyncio
+async def test_mock_steady_state_polls_are_stable():
+    """Repeated polls of a finished session return the same PR and output."""
+    client = MockDevinClient(seed=7)
+    result = await client.create_session(prompt="Fix FIND-0004: sql injection in user-service")
+    sid = result["session_id"]
+    client._sessions[sid]["created_at_monotonic"] -= 120
+    client._sessions[sid]["will_fail"] = False
+
+    first = await client.get_session(sid)
+    second = await client.get_session(sid)
+    assert first["pull_request"]["url"] == second["pull_request"]["url"]
+    assert first["structured_output"] == second["structured_output"]
+    await client.close()
+
+
 @pytest.mark.asyncio
 async def test_mock_list_sessions_with_tags():
     """List sessions filtered by tags."""
@@ -116,7 +132,7 @@ async def test_mock_failure_rate():
 
     # Fast-forward all sessions
     for sid, state in client._sessions.items():
-        state["created_at"] -= 120
+        state["created_at_monotonic"] -= 120
 
     failed = 0
     for sid in client._sessions:
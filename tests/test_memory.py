@@ -6,8 +6,14 @@ from pathlib import Path
 import pytest
 
 from orchestrator.memory.extractor import extract_memories
-from orchestrator.memory.models import MemoryGraph, MemoryGraphEntry, MemoryItem
-from orchestrator.memory.retriever import retrieve_memories
+from orchestrator.memory.models import (
+    MemoryGraph,
+    MemoryGraphEntry,
+    MemoryItem,
+    MemoryRelationship,
+    RelationType,
+)
+from orchestrator.memory.retriever import retrieve_memories, retrieve_memories_batch
 from orchestrator.memory.store import MemoryStore
 from orchestrator.models import (
     BatchRun,
@@ -138,6 +144,32 @@ class TestStore:
         assert len(loaded.entries) == 1
         assert loaded.entries[0].item_id == "FIND-0001"
 
+    def test_cached_graph_reloads_after_external_write(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path / "memory")
+        other = MemoryStore(tmp_path / "memory")
+
+        def _entry(item_id: str) -> MemoryGraphEntry:
+            return MemoryGraphEntry(
+                item_id=item_id,
+                finding_id=item_id,
+                category="sql_injection",
+                service_name="payment-service",
+                severity="high",
+                data_source="mock",
+                outcome="success",
+                created_at=datetime.now(timezone.utc).isoformat(),
+                run_id="test-run",
+            )
+
+        store.save_graph(MemoryGraph(entries=[_entry("FIND-0001")]))
+        first = store.load_graph()
+        # Mutating a returned graph must not leak into later loads
+        first.entries.append(_entry("FIND-LOCAL"))
+        assert [e.item_id for e in store.load_graph().entries] == ["FIND-0001"]
+
+        other.save_graph(MemoryGraph(entries=[_entry("FIND-0001"), _entry("FIND-0002")]))
+        assert [e.item_id for e in store.load_graph().entries] == ["FIND-0001", "FIND-0002"]
+
     def test_save_and_load_item(self, tmp_path: Path) -> None:
         store = MemoryStore(tmp_path / "memory")
         item = MemoryItem(
@@ -159,6 +191,80 @@ class TestStore:
         assert "sql_injection" in content
         assert "Used parameterized queries" in content
 
+    def test_save_items_writes_every_item(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path / "memory")
+        items = [
+            MemoryItem(
+                item_id=f"FIND-000{i}",
+                finding_id=f"FIND-000{i}",
+                category="sql_injection",
+                service_name="payment-service",
+                severity="high",
+                title=f"Finding {i}",
+                data_source="mock",
+                outcome="success",
+                run_id="test-run",
+                created_at=datetime.now(timezone.utc).isoformat(),
+            )
+            for i in range(5)
+        ]
+        store.save_items(items)
+        for item in items:
+            content = store.load_item(item.item_id)
+            assert content is not None
+            assert item.title in content
+
+    def test_upsert_many_streams_in_batches(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path / "memory")
+        items = (
+            MemoryItem(
+                item_id=f"FIND-000{i}",
+                finding_id=f"FIND-000{i}",
+                category="sql_injection",
+                service_name="payment-service",
+                severity="high",
+                title=f"Finding {i}",
+                data_source="mock",
+                outcome="success",
+                run_id="test-run",
+                created_at=datetime.now(timezone.utc).isoformat(),
+            )
+            for i in range(5)
+        )
+        graph = MemoryGraph()
+        count = store.upsert_many(items, graph, batch_size=2)
+        assert count == 5
+        assert [e.item_id for e in graph.entries] == [f"FIND-000{i}" for i in range(5)]
+        assert all(store.load_item(f"FIND-000{i}") is not None for i in range(5))
+
+    def test_save_item_skips_unchanged_content(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path / "memory")
+        item = MemoryItem(
+            item_id="FIND-0001",
+            finding_id="FIND-0001",
+            category="sql_injection",
+            service_name="payment-service",
+            severity="high",
+            title="Test SQL Injection",
+            data_source="mock",
+            outcome="success",
+            run_id="test-run",
+            created_at="2026-01-01T00:00:00+00:00",
+        )
+        md_path = tmp_path / "memory" / "items" / "FIND-0001.md"
+        store.save_item(item)
+        before = md_path.stat().st_mtime_ns
+
+        # Same content from a fresh store (no digest cache) is not rewritten
+        MemoryStore(tmp_path / "memory").save_item(item)
+        store.save_item(item)
+        assert md_path.stat().st_mtime_ns == before
+
+        # External edits are detected and overwritten
+        md_path.write_text("edited", encoding="utf-8")
+        store.save_item(item)
+        assert "Test SQL Injection" in md_path.read_text(encoding="utf-8")
+
     def test_upsert_updates_existing(self, tmp_path: Path) -> None:
         store = MemoryStore(tmp_path / "memory")
         graph = MemoryGraph()
@@ -195,6 +301,62 @@ class TestStore:
         assert graph.entries[0].outcome == "success"
 
 
+    def test_graph_round_trip_derives_relationships(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path / "memory")
+        graph = MemoryGraph()
+        for i, service in enumerate(["svc-a", "svc-b"]):
+            item = MemoryItem(
+                item_id=f"FIND-000{i}",
+                finding_id=f"FIND-000{i}",
+                category="sql_injection",
+                service_name=service,
+                severity="high",
+                title="T",
+                data_source="mock",
+                outcome="success",
+                run_id="run-1",
+                created_at="2026-01-01T00:00:00+00:00",
+            )
+            graph = store.upsert(item, graph)
+        store.save_graph(graph)
+
+        loaded = MemoryStore(tmp_path / "memory").load_graph()
+        assert loaded.model_dump() == graph.model_dump()
+        assert "relationships" not in (tmp_path / "memory" / "graph.json").read_text()
+        rels = store.relationships_for("FIND-0001", loaded)
+        assert [(r.target_id, r.relation_type) for r in rels] == [
+            ("FIND-0000", RelationType.SAME_CATEGORY)
+        ]
+
+    def test_legacy_graph_with_relationships_loads(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path / "memory")
+        (tmp_path / "memory" / "graph.json").write_text(
+            '{"version": 1, "entries": [{"item_id": "x", "finding_id": "F", '
+            '"category": "xss", "service_name": "s", "severity": "low", '
+            '"data_source": "mock", "outcome": "success", "created_at": "", '
+            '"run_id": "r", "relationships": [{"target_id": "y", '
+            '"relation_type": "same_category"}]}]}',
+            encoding="utf-8",
+        )
+        graph = store.load_graph()
+        assert [e.item_id for e in graph.entries] == ["x"]
+        assert "relationships" not in graph.entries[0].model_dump()
+
+    def test_relation_type_accepts_legacy_names(self) -> None:
+        rel = MemoryRelationship.model_validate(
+            {"target_id": "x", "relation_type": "same_service"}
+        )
+        assert rel.relation_type is RelationType.SAME_SERVICE
+        assert rel.model_dump(mode="json") == {"target_id": "x", "relation_type": 2}
+
+    def test_malformed_graph_loads_empty(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path / "memory")
+        (tmp_path / "memory" / "graph.json").write_text(
+            '{"version": 1, "entries": [{"item_id": "x"}]}', encoding="utf-8"
+        )
+        assert store.load_graph().entries == []
+
+
 class TestRetriever:
     def _build_store_with_entries(self, tmp_path: Path) -> MemoryStore:
         store = MemoryStore(tmp_path / "memory")
@@ -288,6 +450,18 @@ class TestRetriever:
         results = retrieve_memories(finding, store, max_results=1)
         assert len(results) <= 1
 
+    def test_batch_matches_single_retrieval(self, tmp_path: Path) -> None:
+        store = self._build_store_with_entries(tmp_path)
+        findings = [
+            _make_finding("FIND-A", "sql_injection", "payment-service"),
+            _make_finding("FIND-B", "xss", "other-service"),
+        ]
+        batch = retrieve_memories_batch(findings, store, max_results=3)
+        assert set(batch) == {"FIND-A", "FIND-B"}
+        assert batch["FIND-B"] == []
+        single = retrieve_memories(findings[0], store, max_results=3)
+        assert [r["content"] for r in batch["FIND-A"]] == [r["content"] for r in single]
+
     def test_cross_run_accumulation(self, tmp_path: Path) -> None:
         """Same finding across two runs should produce two distinct graph entries."""
         store = MemoryStore(tmp_path / "memory")
@@ -329,8 +503,9 @@ class TestRetriever:
         assert graph.entries[1].item_id == "run-2-FIND-0001"
 
         # They should have a same_category + same_service relationship
-        assert len(graph.entries[1].relationships) >= 1
-        rel_targets = {r.target_id for r in graph.entries[1].relationships}
+        rels = store.relationships_for("run-2-FIND-0001", graph)
+        assert len(rels) >= 1
+        rel_targets = {r.target_id for r in rels}
         assert "run-1-FIND-0001" in rel_targets
 
         # Retrieval should return both, with live/success ranked higher
@@ -1,6 +1,7 @@
+import asyncio
 import json
 import tempfile
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock
 
@@ -12,7 +13,12 @@ from orchestrator.models import (
     SessionStatus, Severity, Wave,
 )
 from orchestrator.monitor.tracker import ProgressTracker
-from orchestrator.monitor.poller import poll_session, poll_active_sessions
+from orchestrator.monitor.webhook import (
+    SIGNATURE_HEADER, WEBHOOK_PATH, create_webhook_app, sign_payload,
+)
+from orchestrator.monitor.poller import (
+    _next_poll_delay, poll_active_sessions, poll_session, seconds_until_next_poll,
+)
 
 
 def _make_finding(fid: str = "FIND-0001") -> Finding:
@@ -80,6 +86,33 @@ class TestProgressTracker:
         assert summary["prs_created"] == 2
         assert summary["success_rate"] == pytest.approx(2 / 3)
 
+    def test_incremental_counts_match_full_recount(self):
+        import random
+
+        rng = random.Random(7)
+        run = _make_batch_run([5, 5, 5])
+        tracker = ProgressTracker(run, state_file_path="/tmp/test_state.json")
+        sessions = [s for w in run.waves for s in w.sessions]
+        statuses = list(SessionStatus)
+
+        for _ in range(200):
+            session = rng.choice(sessions)
+            session.status = rng.choice(statuses)
+            session.pr_url = rng.choice([None, "https://github.com/org/repo/pull/1"])
+            tracker.update_session(session)
+
+        counts = (
+            run.completed, run.successful, run.failed, run.prs_created,
+            [(w.success_count, w.failure_count) for w in run.waves],
+        )
+        summary = tracker.get_summary()
+        tracker._recount()
+        assert counts == (
+            run.completed, run.successful, run.failed, run.prs_created,
+            [(w.success_count, w.failure_count) for w in run.waves],
+        )
+        assert summary == tracker.get_summary()
+
     def test_add_event(self):
         run = _make_batch_run()
         tracker = ProgressTracker(run)
@@ -90,6 +123,59 @@ class TestProgressTracker:
         assert run.events[0]["message"] == "Session FIND-0001 started"
         assert "timestamp" in run.events[0]
 
+    @pytest.mark.asyncio
+    async def test_wait_for_change_wakes_on_update_session(self):
+        run = _make_batch_run([2])
+        tracker = ProgressTracker(run, state_file_path="/tmp/test_state.json")
+        seen = tracker.change_count
+        assert await tracker.wait_for_change(0.01, seen) is False
+
+        session = run.waves[0].sessions[0]
+
+        async def push() -> None:
+            await asyncio.sleep(0.01)
+            session.status = SessionStatus.SUCCESS
+            tracker.update_session(session)
+
+        task = asyncio.create_task(push())
+        assert await tracker.wait_for_change(5.0, seen) is True
+        await task
+
+        # A change made before the wait starts (mid poll pass) is not lost
+        seen = tracker.change_count
+        session.status = SessionStatus.FAILED
+        tracker.update_session(session)
+        assert await tracker.wait_for_change(5.0, seen) is True
+
+    def test_find_session_follows_reassigned_ids(self):
+        run = _make_batch_run([2, 2])
+        tracker = ProgressTracker(run, state_file_path="/tmp/test_state.json")
+        target = run.waves[1].sessions[0]
+        target.session_id = "ses-1"
+        assert tracker.find_session("ses-1") is target
+        assert tracker.find_session("ses-missing") is None
+
+        # A retry dispatches a new Devin session for the same finding
+        target.session_id = "ses-2"
+        assert tracker.find_session("ses-1") is None
+        assert tracker.find_session("ses-2") is target
+
+    def test_events_bounded_in_state_and_appended_to_jsonl(self):
+        from orchestrator.monitor.tracker import _MAX_RECENT_EVENTS
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run = _make_batch_run()
+            tracker = ProgressTracker(run, f"{tmpdir}/state.json", f"{tmpdir}/runs")
+            for i in range(_MAX_RECENT_EVENTS + 10):
+                tracker.add_event("session_progress", f"event {i}")
+            tracker.close()
+
+            assert len(run.events) == _MAX_RECENT_EVENTS
+            assert run.events[0]["message"] == "event 10"
+            lines = Path(tmpdir, "runs", run.run_id, "events.jsonl").read_text().splitlines()
+            assert len(lines) == _MAX_RECENT_EVENTS + 10
+            assert json.loads(lines[-1])["message"] == f"event {_MAX_RECENT_EVENTS + 9}"
+
     def test_save_state(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             state_path = str(Path(tmpdir) / "state.json")
@@ -107,6 +193,47 @@ class TestProgressTracker:
             assert restored.run_id == "test-run-001"
 
 
+    def test_save_state_links_legacy_path_and_reuses_settled_waves(self, tmp_path: Path):
+        run = _make_batch_run([2, 2])
+        for session in run.waves[0].sessions:
+            session.status = SessionStatus.SUCCESS
+        legacy = tmp_path / "state.json"
+        tracker = ProgressTracker(run, state_file_path=str(legacy), runs_dir=str(tmp_path / "runs"))
+        tracker.save_state()
+
+        run_state = tmp_path / "runs" / "test-run-001" / "state.json"
+        assert legacy.is_symlink()
+        assert legacy.read_bytes() == run_state.read_bytes()
+
+        # A settled wave's dump is reused until one of its sessions changes
+        first = tracker._dump_wave(run.waves[0])
+        assert tracker._dump_wave(run.waves[0]) is first
+        run.waves[0].sessions[0].status = SessionStatus.FAILED
+        assert tracker._dump_wave(run.waves[0])["sessions"][0]["status"] == "failed"
+
+        tracker.save_state()
+        assert json.loads(legacy.read_text()) == run.model_dump(mode="json")
+
+    def test_update_index_skips_unchanged_summary(self, tmp_path: Path, monkeypatch):
+        import orchestrator.monitor.tracker as tracker_mod
+
+        writes = []
+        real_write = tracker_mod.atomic_write_json
+        monkeypatch.setattr(
+            tracker_mod, "atomic_write_json", lambda p, d: (writes.append(d), real_write(p, d))
+        )
+        run = _make_batch_run()
+        tracker = ProgressTracker(run, str(tmp_path / "state.json"), str(tmp_path / "runs"))
+        tracker.save_state()
+        tracker.save_state()
+        assert len(writes) == 1
+
+        run.status = "completed"
+        tracker.save_state()
+        assert len(writes) == 2
+        entries = json.loads((tmp_path / "runs" / "index.json").read_text())
+        assert [e["status"] for e in entries] == ["completed"]
+
 class TestPoller:
     @pytest.mark.asyncio
     async def test_poll_session_working(self):
@@ -182,3 +309,176 @@ class TestPoller:
         assert mock_client.get_session.call_count == 2
         # Both are still active (working)
         assert len(still_active) == 2
+
+    @pytest.mark.asyncio
+    async def test_poll_active_sessions_polls_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def get_session(session_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {
+                "status_enum": "finished",
+                "structured_output": {"status": "completed"},
+                "pull_request": {"url": f"https://github.com/test/repo/pull/{session_id}"},
+            }
+
+        mock_client = AsyncMock()
+        mock_client.get_session.side_effect = get_session
+
+        sessions = [_make_session(f"F-{i}", status=SessionStatus.WORKING) for i in range(4)]
+        for i, s in enumerate(sessions):
+            s.session_id = f"ses-{i}"
+
+        run = _make_batch_run([4])
+        tracker = ProgressTracker(run, state_file_path="/tmp/test_state.json")
+
+        still_active = await poll_active_sessions(mock_client, sessions, tracker, OrchestratorConfig())
+
+        assert peak == 4
+        assert still_active == []
+        # Events are still applied in session order
+        completed = [
+            e["details"]["finding_id"]
+            for e in run.events
+            if e["event_type"] == "session_completed"
+        ]
+        assert completed == ["F-0", "F-1", "F-2", "F-3"]
+
+        # At most max_poll_concurrency polls are in flight
+        peak = 0
+        for s in sessions:
+            s.status = SessionStatus.WORKING
+            s.next_poll_at = None
+        await poll_active_sessions(
+            mock_client, sessions, tracker, OrchestratorConfig(max_poll_concurrency=2)
+        )
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_poll_active_sessions_skips_sessions_not_due(self):
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {
+            "status_enum": "working",
+            "structured_output": {"status": "fixing"},
+            "pull_request": None,
+        }
+        sessions = [_make_session(f"F-{i}", status=SessionStatus.WORKING) for i in range(2)]
+        for i, s in enumerate(sessions):
+            s.session_id = f"ses-{i}"
+        sessions[1].next_poll_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+        tracker = ProgressTracker(_make_batch_run([2]), state_file_path="/tmp/test_state.json")
+        config = OrchestratorConfig()
+        still_active = await poll_active_sessions(mock_client, sessions, tracker, config)
+
+        mock_client.get_session.assert_called_once_with("ses-0")
+        assert still_active == sessions
+        assert sessions[0].next_poll_at is not None
+        assert sessions[0].stage_entered_at is not None
+        assert 0 < seconds_until_next_poll(sessions, config) <= config.poll_interval_seconds
+
+    def test_next_poll_delay_adapts_to_stage_history(self):
+        config = OrchestratorConfig(poll_interval_seconds=20)
+        tracker = ProgressTracker(_make_batch_run([1]), state_file_path="/tmp/test_state.json")
+        now = datetime.now(timezone.utc)
+        session = _make_session(status=SessionStatus.WORKING)
+        session.structured_output = {"status": "analyzing"}
+        session.stage_entered_at = now - timedelta(seconds=10)
+
+        # Young sessions are polled quickly
+        session.created_at = now - timedelta(seconds=5)
+        assert _next_poll_delay(session, tracker, config, now) == 2.0
+
+        # No stage history yet: the configured interval
+        session.created_at = now - timedelta(minutes=5)
+        assert _next_poll_delay(session, tracker, config, now) == 20.0
+
+        # With history, wait half the expected remaining dwell, capped at 1.5x
+        for _ in range(3):
+            tracker.record_stage_dwell("analyzing", 100.0)
+        assert _next_poll_delay(session, tracker, config, now) == 30.0
+        session.stage_entered_at = now - timedelta(seconds=90)
+        assert _next_poll_delay(session, tracker, config, now) == 5.0
+        # Overdue for a transition: back to the configured interval
+        session.stage_entered_at = now - timedelta(seconds=200)
+        assert _next_poll_delay(session, tracker, config, now) == 20.0
+
+
+
+class TestWebhook:
+    async def _post(self, app, body: bytes, signature: str):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.post(
+                WEBHOOK_PATH, data=body, headers={SIGNATURE_HEADER: signature}
+            )
+            return resp.status, await resp.json()
+
+    def _setup(self, tmp_path: Path):
+        run = _make_batch_run([2])
+        session = run.waves[0].sessions[0]
+        session.session_id = "ses-1"
+        session.status = SessionStatus.WORKING
+        tracker = ProgressTracker(
+            run, state_file_path=str(tmp_path / "state.json"), runs_dir=str(tmp_path / "runs")
+        )
+        config = OrchestratorConfig(webhook_secret="s3cret", poll_interval_seconds=20)
+        return run, session, tracker, create_webhook_app(tracker, config)
+
+    @pytest.mark.asyncio
+    async def test_push_applies_session_update(self, tmp_path: Path):
+        run, session, tracker, app = self._setup(tmp_path)
+        body = json.dumps({
+            "session_id": "ses-1",
+            "status_enum": "finished",
+            "structured_output": {"status": "completed"},
+            "pull_request": {"url": "https://github.com/test/repo/pull/9"},
+        }).encode()
+
+        status, data = await self._post(app, body, sign_payload("s3cret", body))
+
+        assert status == 200 and data == {"ok": True}
+        assert session.status == SessionStatus.SUCCESS
+        assert session.pr_url == "https://github.com/test/repo/pull/9"
+        assert session.webhook_confirmed
+        assert run.successful == 1
+        assert any(e["event_type"] == "session_completed" for e in run.events)
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_signature_and_unknown_session(self, tmp_path: Path):
+        _, session, _, app = self._setup(tmp_path)
+        body = json.dumps({"session_id": "ses-1", "status_enum": "finished"}).encode()
+        status, _ = await self._post(app, body, "bad")
+        assert status == 401
+        status, _ = await self._post(app, body, "é")
+        assert status == 401
+        assert session.status == SessionStatus.WORKING
+
+        body = json.dumps({"session_id": "ses-404", "status_enum": "finished"}).encode()
+        status, _ = await self._post(app, body, sign_payload("s3cret", body))
+        assert status == 404
+
+        for bad_id in (["ses-1"], {}, 7):
+            body = json.dumps({"session_id": bad_id, "status_enum": "finished"}).encode()
+            status, _ = await self._post(app, body, sign_payload("s3cret", body))
+            assert status == 400
+        assert session.status == SessionStatus.WORKING
+
+    def test_confirmed_sessions_fall_back_to_slow_polling(self):
+        config = OrchestratorConfig(poll_interval_seconds=20, webhook_fallback_poll_seconds=60)
+        tracker = ProgressTracker(_make_batch_run([1]), state_file_path="/tmp/test_state.json")
+        session = _make_session(status=SessionStatus.WORKING)
+        session.webhook_confirmed = True
+        assert _next_poll_delay(session, tracker, config, datetime.now(timezone.utc)) == 60.0
+
+    def test_requires_secret(self):
+        tracker = ProgressTracker(_make_batch_run([1]), state_file_path="/tmp/test_state.json")
+        with pytest.raises(ValueError):
+            create_webhook_app(tracker, OrchestratorConfig(webhook_secret=""))
+
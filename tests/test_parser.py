@@ -0,0 +1,62 @@
+import logging
+from pathlib import Path
+
+from orchestrator.ingest.parser import parse_findings_csv
+from orchestrator.models import FindingCategory, Severity
+
+_BASE_COLUMNS = [
+    "finding_id", "scanner", "category", "severity", "title", "description",
+    "service_name", "repo_url", "file_path",
+]
+_BASE_VALUES = {
+    "finding_id": "F-1",
+    "scanner": "semgrep",
+    "category": "xss",
+    "severity": "high",
+    "title": "Reflected XSS",
+    "description": "Unescaped output",
+    "service_name": "web",
+    "repo_url": "https://github.com/org/web",
+    "file_path": "app/views.py",
+}
+
+
+def _write_csv(tmp_path: Path, columns: list[str], values: dict[str, str]) -> str:
+    path = tmp_path / "findings.csv"
+    path.write_text(
+        ",".join(columns) + "\n" + ",".join(values.get(c, "") for c in columns) + "\n",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+class TestParseFindingsCsv:
+    def test_parses_row(self, tmp_path: Path) -> None:
+        columns = _BASE_COLUMNS + ["line_number", "language"]
+        path = _write_csv(tmp_path, columns, {**_BASE_VALUES, "line_number": "42", "language": "python"})
+
+        [finding] = parse_findings_csv(path)
+
+        assert finding.finding_id == "F-1"
+        assert finding.category == FindingCategory.XSS
+        assert finding.severity == Severity.HIGH
+        assert finding.line_number == 42
+        assert finding.language == "python"
+        assert finding.cwe_id is None
+
+    def test_missing_line_number_column_parses_as_none(self, tmp_path: Path) -> None:
+        path = _write_csv(tmp_path, _BASE_COLUMNS, _BASE_VALUES)
+
+        findings = parse_findings_csv(path)
+
+        assert [(f.finding_id, f.line_number) for f in findings] == [("F-1", None)]
+
+    def test_missing_category_or_severity_column_skips_rows(self, tmp_path: Path, caplog) -> None:
+        for column in ("category", "severity"):
+            columns = [c for c in _BASE_COLUMNS if c != column]
+            path = _write_csv(tmp_path, columns, _BASE_VALUES)
+
+            with caplog.at_level(logging.WARNING, logger="orchestrator.ingest.parser"):
+                assert parse_findings_csv(path) == []
+            assert f"invalid {column}" in caplog.text
+            caplog.clear()
@@ -0,0 +1,45 @@
+from orchestrator.ingest.prioritizer import prioritize_findings, prioritize_top_k
+from orchestrator.models import Finding, FindingCategory, Severity
+
+
+def _make_finding(fid: str, category: FindingCategory, severity: Severity, service: str) -> Finding:
+    """Helper to create a minimal Finding for testing."""
+    return Finding(
+        finding_id=fid,
+        scanner="test",
+        category=category,
+        severity=severity,
+        title=f"Test finding {fid}",
+        description="Test",
+        service_name=service,
+        repo_url="https://github.com/test/repo",
+        file_path="test.py",
+    )
+
+
+def _sample_findings() -> list[Finding]:
+    return [
+        _make_finding("F-001", FindingCategory.ACCESS_LOGGING, Severity.LOW, "unknown-service"),
+        _make_finding("F-002", FindingCategory.SQL_INJECTION, Severity.CRITICAL, "payment-service"),
+        _make_finding("F-003", FindingCategory.XSS, Severity.HIGH, "catalog-service"),
+        _make_finding("F-004", FindingCategory.XSS, Severity.HIGH, "catalog-service"),
+        _make_finding("F-005", FindingCategory.PII_LOGGING, Severity.MEDIUM, "user-service"),
+    ]
+
+
+class TestPrioritizeFindings:
+    def test_scores_and_orders_highest_first(self):
+        findings = _sample_findings()
+        result = prioritize_findings(findings)
+        assert [f.finding_id for f in result] == ["F-002", "F-003", "F-004", "F-005", "F-001"]
+        assert result[0].priority_score == 85.0
+        assert result[-1].priority_score == 25.0
+        # Input order untouched, scores written in place
+        assert [f.finding_id for f in findings] == ["F-001", "F-002", "F-003", "F-004", "F-005"]
+        assert findings[0].priority_score == 25.0
+
+    def test_top_k_matches_full_sort_prefix(self):
+        full = [f.finding_id for f in prioritize_findings(_sample_findings())]
+        for k in range(0, 7):
+            top = prioritize_top_k(_sample_findings(), k)
+            assert [f.finding_id for f in top] == full[:k]
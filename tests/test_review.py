@@ -191,3 +191,18 @@ class TestServiceOverrides:
         assert "Prior Remediation Knowledge" in prompt
         assert "mvn test" in prompt
         assert "Previously fixed" in prompt
+
+    def test_load_overrides_reloads_after_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        overrides_path = tmp_path / "overrides.json"
+        overrides_path.write_text(json.dumps({"a-service": {}}))
+        monkeypatch.setattr(
+            "orchestrator.devin.session_manager._SERVICE_OVERRIDES_PATH",
+            overrides_path,
+        )
+        first = load_service_overrides()
+        assert load_service_overrides() is first  # served from cache
+
+        overrides_path.write_text(json.dumps({"a-service": {}, "b-service": {}}))
+        assert "b-service" in load_service_overrides()
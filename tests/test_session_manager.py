@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock
 
@@ -13,6 +15,7 @@ from orchestrator.devin.session_manager import (
     REMEDIATION_OUTPUT_SCHEMA,
     build_remediation_prompt,
     create_remediation_session,
+    create_remediation_sessions,
     interpret_session_status,
 )
 
@@ -133,6 +136,45 @@ class TestCreateRemediationSession:
         assert call_kwargs.get("playbook_id") is None or call_kwargs.get("playbook_id") == ""
 
 
+class TestCreateRemediationSessions:
+    @pytest.mark.asyncio
+    async def test_creates_concurrently_within_limit(self):
+        in_flight = 0
+        peak = 0
+
+        async def fake_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "FIND-0002" in kwargs["prompt"]:
+                raise Exception("API down")
+            return {"session_id": "ses-ok", "url": None}
+
+        mock_client = AsyncMock()
+        mock_client.create_session.side_effect = fake_create
+        sessions = [
+            RemediationSession(
+                finding=_make_finding(finding_id=f"FIND-000{i}"), playbook_id="", wave_number=1,
+            )
+            for i in range(1, 6)
+        ]
+        config = OrchestratorConfig(max_concurrent_creates=2)
+
+        result = await create_remediation_sessions(
+            [(mock_client, s, "mock") for s in sessions], config,
+            memory_contexts={},
+        )
+
+        assert result == sessions
+        assert mock_client.create_session.call_count == 5
+        assert peak == 2
+        assert [s.status for s in sessions].count(SessionStatus.FAILED) == 1
+        assert sessions[1].status == SessionStatus.FAILED
+        assert all(s.data_source == "mock" for s in sessions if s.status == SessionStatus.DISPATCHED)
+
+
 class TestInterpretSessionStatus:
     def test_working(self):
         status, pr_url, error = interpret_session_status(
@@ -182,6 +224,14 @@ class TestInterpretSessionStatus:
         )
         assert status == SessionStatus.WORKING
 
+    def test_unknown_status_warns_once(self, caplog):
+        response = {"status_enum": "another_new_thing", "pull_request": None, "structured_output": None}
+        with caplog.at_level("WARNING", logger="orchestrator.devin.session_manager"):
+            for _ in range(3):
+                status, _, _ = interpret_session_status(response)
+                assert status == SessionStatus.WORKING
+        assert sum("another_new_thing" in r.getMessage() for r in caplog.records) == 1
+
 
 class TestRemediationOutputSchema:
     def test_schema_is_valid_json_schema(self):
@@ -0,0 +1,38 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from orchestrator.utils import FileLockTimeout, with_file_lock
+
+
+class TestWithFileLock:
+    def test_waiter_acquires_soon_after_release(self, tmp_path: Path) -> None:
+        target = tmp_path / "index.json"
+        held = threading.Event()
+
+        def hold() -> None:
+            with with_file_lock(target):
+                held.set()
+                time.sleep(0.05)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        held.wait()
+
+        start = time.monotonic()
+        # Backoff starts at 1ms, so a long poll_interval doesn't delay pickup
+        with with_file_lock(target, poll_interval=1.0):
+            waited = time.monotonic() - start
+        holder.join()
+
+        assert waited < 0.5
+        assert not Path(str(target) + ".lock").exists()
+
+    def test_times_out_while_lock_is_held(self, tmp_path: Path) -> None:
+        target = tmp_path / "index.json"
+        with with_file_lock(target):
+            with pytest.raises(FileLockTimeout):
+                with with_file_lock(target, timeout_seconds=0.05):
+                    pass
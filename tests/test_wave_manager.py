@@ -114,6 +114,8 @@ class TestRetryFailed:
         wave.sessions[0].attempt = 1
         wave.sessions[1].status = SessionStatus.FAILED
         wave.sessions[1].attempt = 1
+        # The failed Devin session had been confirmed by a webhook push
+        wave.sessions[1].webhook_confirmed = True
         wave.sessions[2].status = SessionStatus.TIMEOUT
         wave.sessions[2].attempt = 1
 
@@ -136,6 +138,8 @@ class TestRetryFailed:
         # Sessions 1 and 2 should have been retried (attempt=2)
         assert wave.sessions[1].attempt == 2
         assert wave.sessions[2].attempt == 2
+        # The new Devin session has not been confirmed by a push yet
+        assert wave.sessions[1].webhook_confirmed is False
         # Session 0 was not retried
         assert wave.sessions[0].attempt == 1
 
@@ -156,3 +160,40 @@ class TestRetryFailed:
         # Should NOT have been retried
         assert wave.sessions[0].attempt == 2
         assert mock_client.create_session.call_count == 0
+
+
+class TestCleanupSessions:
+    @pytest.mark.asyncio
+    async def test_terminates_finished_sessions_concurrently(self):
+        run = _make_batch_run([3])
+        wave = run.waves[0]
+        for i, session in enumerate(wave.sessions):
+            session.session_id = f"ses-{i}"
+            session.status = SessionStatus.SUCCESS
+        wave.sessions[2].status = SessionStatus.WORKING
+
+        in_flight = 0
+        peak = 0
+        terminated: list[str] = []
+
+        async def terminate(session_id: str) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if session_id == "ses-0":
+                raise RuntimeError("already gone")
+            terminated.append(session_id)
+
+        client = AsyncMock()
+        client.terminate_session.side_effect = terminate
+        tracker = ProgressTracker(run, state_file_path="/tmp/test.json")
+        wm = WaveManager(client, OrchestratorConfig(), tracker)
+
+        await wm._cleanup_sessions(wave)
+
+        # The working session is left alone; one failure doesn't stop the rest
+        assert client.terminate_session.await_count == 2
+        assert terminated == ["ses-1"]
+        assert peak == 2